@@ -17,6 +17,7 @@ __description__ = "LangGraph MCP Server for Jr Dev Agent"
 # Package imports
 from .utils.load_ticket_metadata import (
     load_ticket_metadata,
+    aload_ticket_metadata,
     load_from_fallback,
     validate_ticket_metadata,
     get_fallback_status,
@@ -35,6 +36,7 @@ from .nodes.jira_prompt_node import (
 __all__ = [
     # Utils
     "load_ticket_metadata",
+    "aload_ticket_metadata",
     "load_from_fallback", 
     "validate_ticket_metadata",
     "get_fallback_status",
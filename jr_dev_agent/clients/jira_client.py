@@ -6,16 +6,45 @@ This module encapsulates the HTTP calls required to talk to the enterprise
 Jira MCP server.  It gracefully falls back to the local development dataset
 when real credentials are not available so the rest of the application can
 continue to function in mock mode.
+
+``afetch_ticket`` is the preferred entry point from async code (FastAPI
+handlers, LangGraph nodes) so a Jira round-trip never blocks the event loop.
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
+import importlib.util
 import logging
 import os
-from typing import Any, Dict, Optional
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+import orjson
+
+
+# Ticket bodies rarely change inside a dev session; keep recent fetches around
+# so retries and prompt re-generation skip the MCP round-trip.
+TICKET_CACHE_MAXSIZE = 256
+TICKET_CACHE_TTL_SECONDS = 300.0
 
-import requests
+# HTTP/2 lets concurrent fetches multiplex over one connection; it needs the
+# optional ``h2`` package (``httpx[http2]``), so fall back to HTTP/1.1 without it.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+# Two retry layers: the transport re-dials failed connects (ConnectError /
+# ConnectTimeout only), and the fetch loop re-sends on retryable statuses.
+# They multiply, so a fetch makes at most
+# (_CONNECT_RETRIES + 1) * (_MAX_RETRIES + 1) = 8 connect attempts.
+_CONNECT_RETRIES = 1
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_MAX_RETRIES = 3
+_RETRY_BACKOFF_SECONDS = 0.2
 
 
 class JiraMCPClient:
@@ -26,35 +55,57 @@ class JiraMCPClient:
         base_url: Optional[str] = None,
         token: Optional[str] = None,
         timeout: int = 10,
+        cache_ttl: float = TICKET_CACHE_TTL_SECONDS,
     ):
         self.logger = logging.getLogger(__name__)
         self.base_url = (base_url or os.getenv("JIRA_MCP_URL") or "").rstrip("/")
         self.token = token or os.getenv("JIRA_MCP_TOKEN") or os.getenv("PINGFED_TOKEN")
         self.timeout = timeout
 
+        # Static per client - computed once and installed on both clients
+        self._default_headers: Dict[str, str] = {"Content-Type": "application/json"}
+        if self.token:
+            self._default_headers["Authorization"] = f"Bearer {self.token}"
+        # Pooled connections belong to the loop that opened them, so each event
+        # loop gets its own async client; entries go away with their loop
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sync_client: Optional[httpx.Client] = None
+        self.cache_ttl = cache_ttl
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
     # ------------------------------------------------------------------ utils
     @property
     def configured(self) -> bool:
         return bool(self.base_url and self.token)
 
-    def _headers(self) -> Dict[str, str]:
-        headers = {"Content-Type": "application/json"}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        return headers
-
-    # ------------------------------------------------------------------ public
-    def fetch_ticket(self, ticket_id: str) -> Dict[str, Any]:
-        """
-        Fetch ticket details from the MCP server.
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily create the async client for the running event loop (one connection pool per loop)."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=self._default_headers,
+                transport=httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=_POOL_LIMITS, retries=_CONNECT_RETRIES),
+            )
+            self._clients[loop] = client
+        return client
 
-        Raises:
-            RuntimeError: when the MCP call fails or returns malformed data.
-        """
-        if not self.configured:
-            raise RuntimeError("Jira MCP client is not configured with URL/token")
+    def _get_sync_client(self) -> httpx.Client:
+        """Lazily create the blocking client used by :meth:`fetch_ticket`."""
+        if self._sync_client is None or self._sync_client.is_closed:
+            self._sync_client = httpx.Client(
+                timeout=self.timeout,
+                headers=self._default_headers,
+                transport=httpx.HTTPTransport(http2=HTTP2_AVAILABLE, limits=_POOL_LIMITS, retries=_CONNECT_RETRIES),
+            )
+        return self._sync_client
 
-        payload = {
+    def _build_payload(self, ticket_id: str) -> Dict[str, Any]:
+        return {
             "jsonrpc": "2.0",
             "id": f"jrdev-fetch-{ticket_id}",
             "method": "tools/call",
@@ -64,18 +115,8 @@ class JiraMCPClient:
             },
         }
 
-        try:
-            response = requests.post(
-                f"{self.base_url}/tools/call",
-                headers=self._headers(),
-                data=json.dumps(payload),
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            body = response.json()
-        except Exception as exc:
-            raise RuntimeError(f"Failed to call Jira MCP: {exc!s}") from exc
-
+    @staticmethod
+    def _extract_ticket(body: Any) -> Dict[str, Any]:
         result = body.get("result") if isinstance(body, dict) else None
         if not result:
             raise RuntimeError(f"Jira MCP response missing result: {body}")
@@ -85,3 +126,141 @@ class JiraMCPClient:
             raise RuntimeError(f"Jira MCP response missing ticket payload: {body}")
 
         return ticket
+
+    def _cache_get(self, ticket_id: str, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        key = (self.base_url, ticket_id)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            cached_at, ticket = entry
+            # Expired entries stay until LRU eviction so a failed refetch can
+            # still serve the last good payload
+            if not allow_stale and time.monotonic() - cached_at > self.cache_ttl:
+                return None
+            self._cache.move_to_end(key)
+        # Callers enrich the returned dict in place; never hand out the cached one
+        return dict(ticket)
+
+    def _cache_put(self, ticket_id: str, ticket: Dict[str, Any]) -> None:
+        with self._cache_lock:
+            self._cache[(self.base_url, ticket_id)] = (time.monotonic(), dict(ticket))
+            self._cache.move_to_end((self.base_url, ticket_id))
+            while len(self._cache) > TICKET_CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+
+    def _start_fetch(self, ticket_id: str, force_refresh: bool) -> Optional[Dict[str, Any]]:
+        """Check configuration and return a fresh cached ticket, if any."""
+        if not self.configured:
+            raise RuntimeError("Jira MCP client is not configured with URL/token")
+        return None if force_refresh else self._cache_get(ticket_id)
+
+    def _request(self, ticket_id: str) -> Tuple[str, bytes]:
+        return f"{self.base_url}/tools/call", orjson.dumps(self._build_payload(ticket_id))
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+        """Backoff before re-sending, or None when ``response`` is final."""
+        if response.status_code not in _RETRY_STATUSES or attempt >= _MAX_RETRIES:
+            return None
+        return _RETRY_BACKOFF_SECONDS * 2 ** attempt
+
+    @staticmethod
+    def _decode(response: httpx.Response) -> Any:
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _stale_or_raise(self, ticket_id: str, exc: Exception) -> Dict[str, Any]:
+        """Serve the last cached payload for a failed fetch, or raise RuntimeError."""
+        stale = self._cache_get(ticket_id, allow_stale=True)
+        if stale is None:
+            raise RuntimeError(f"Failed to call Jira MCP: {exc!s}") from exc
+        self.logger.warning("Jira MCP fetch failed for %s - serving cached ticket: %s", ticket_id, exc)
+        return stale
+
+    def _finish_fetch(self, ticket_id: str, body: Any) -> Dict[str, Any]:
+        ticket = self._extract_ticket(body)
+        self._cache_put(ticket_id, ticket)
+        return ticket
+
+    # ------------------------------------------------------------------ public
+    def invalidate(self, ticket_id: Optional[str] = None) -> None:
+        """Drop the cached payload for ``ticket_id`` (or every ticket when omitted)."""
+        with self._cache_lock:
+            if ticket_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop((self.base_url, ticket_id), None)
+
+    async def afetch_ticket(self, ticket_id: str, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Fetch ticket details from the MCP server without blocking the event loop.
+
+        Recently fetched tickets are served from a TTL cache unless
+        ``force_refresh`` is set. When the MCP call fails, the last cached
+        payload for the ticket is returned even if it has expired.
+
+        Raises:
+            RuntimeError: when the MCP call fails or returns malformed data.
+        """
+        cached = self._start_fetch(ticket_id, force_refresh)
+        if cached is not None:
+            return cached
+
+        url, content = self._request(ticket_id)
+        try:
+            client = self._get_client()
+            attempt = 0
+            while True:
+                response = await client.post(url, content=content)
+                delay = self._retry_delay(response, attempt)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+                attempt += 1
+            body = self._decode(response)
+        except Exception as exc:
+            return self._stale_or_raise(ticket_id, exc)
+
+        return self._finish_fetch(ticket_id, body)
+
+    def fetch_ticket(self, ticket_id: str, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Blocking variant of :meth:`afetch_ticket` for CLI scripts and sync callers.
+        Shares its cache and stale-on-failure behaviour.
+
+        Raises:
+            RuntimeError: when the MCP call fails or returns malformed data.
+        """
+        cached = self._start_fetch(ticket_id, force_refresh)
+        if cached is not None:
+            return cached
+
+        url, content = self._request(ticket_id)
+        try:
+            client = self._get_sync_client()
+            attempt = 0
+            while True:
+                response = client.post(url, content=content)
+                delay = self._retry_delay(response, attempt)
+                if delay is None:
+                    break
+                time.sleep(delay)
+                attempt += 1
+            body = self._decode(response)
+        except Exception as exc:
+            return self._stale_or_raise(ticket_id, exc)
+
+        return self._finish_fetch(ticket_id, body)
+
+    def close(self) -> None:
+        """Release pooled connections held by the blocking client."""
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+    async def aclose(self) -> None:
+        """Close the running loop's pooled async client, if one was created."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
@@ -21,7 +21,7 @@ from jr_dev_agent.utils.load_ticket_metadata import load_ticket_metadata
 from jr_dev_agent.nodes.jira_prompt_node import JiraPromptNode
 from jr_dev_agent.services.prompt_builder import PromptBuilder
 from jr_dev_agent.services.template_engine import TemplateEngine
-from jr_dev_agent.services.synthetic_memory import SyntheticMemory
+from jr_dev_agent.services.synthetic_memory import SyntheticMemory, get_memory_service
 from jr_dev_agent.services.pess_client import PESSClient
 from jr_dev_agent.services.prompt_composer import PromptComposer
 
@@ -73,6 +73,8 @@ class JrDevGraph:
         self.synthetic_memory = SyntheticMemory()
         self.pess_client = PESSClient()
         self.prompt_composer = PromptComposer()
+        # Pending PESS session-start calls by session_id, awaited before prompt_generated
+        self._session_starts: Dict[str, asyncio.Task] = {}
         
     async def initialize(self):
         """Initialize the LangGraph workflow"""
@@ -137,13 +139,6 @@ class JrDevGraph:
         try:
             self.logger.info(f"Processing ticket {ticket_data['ticket_id']} in session {session_id}")
             
-            # Record session start for PESS tracking
-            await self.pess_client.record_session_start(
-                ticket_data['ticket_id'], 
-                session_id, 
-                {"source": "langgraph_workflow", "project_root": project_root}
-            )
-            
             # Initialize state
             initial_state = JrDevState(
                 ticket_id=ticket_data['ticket_id'],
@@ -161,8 +156,22 @@ class JrDevGraph:
                 metadata={}
             )
             
-            # Run the workflow
-            result = await self.graph.ainvoke(initial_state)
+            # Record the PESS session start while the workflow runs; the prompt node
+            # waits for it so session_start still reaches PESS before prompt_generated
+            session_start = asyncio.create_task(
+                self.pess_client.record_session_start(
+                    ticket_data['ticket_id'], 
+                    session_id, 
+                    {"source": "langgraph_workflow", "project_root": project_root}
+                )
+            )
+            self._session_starts[session_id] = session_start
+            try:
+                result = await self.graph.ainvoke(initial_state)
+            finally:
+                self._session_starts.pop(session_id, None)
+                await asyncio.wait([session_start])
+            session_start.result()
             
             # Calculate processing time (timezone-aware, tolerate naive start)
             start_dt = result['processing_start']
@@ -266,12 +275,8 @@ class JrDevGraph:
                 memory_root = os.path.join(state['project_root'], "syntheticMemory")
                 self.logger.info(f"Using project-specific memory root: {memory_root}")
                 
-                # Create temp instance for this request
-                memory_service = SyntheticMemory(root=memory_root, backend="fs")
-                # Initialize strictly to avoid config.json override if present in CWD
-                # We manually set initialized=True after ensuring dir exists, 
-                # or we trust our previous fix in SyntheticMemory.initialize() which respects explicit root.
-                await memory_service.initialize()
+                # Shared per-root instance; initialize() respects the explicit root over config.json
+                memory_service = await get_memory_service(memory_root)
             else:
                 self.logger.info("Using default agent memory root")
                 memory_service = self.synthetic_memory
@@ -374,7 +379,7 @@ class JrDevGraph:
             self.logger.info(f"Generating prompt for {state['ticket_id']}")
             
             # Generate base prompt using PromptBuilder
-            base_prompt = await self.prompt_builder.generate_prompt(
+            base_prompt = self.prompt_builder.generate_prompt(
                 template_name=state['template_used'],
                 ticket_data=state['ticket_data'],
                 enrichment_data=state['metadata'].get('enrichment', {})
@@ -424,7 +429,10 @@ class JrDevGraph:
             state['current_step'] = "generate_prompt"
             state['steps_completed'].append("generate_prompt")
             
-            # Record prompt generation for PESS tracking
+            # Record prompt generation for PESS tracking, after the session start
+            session_start = self._session_starts.get(state['session_id'])
+            if session_start is not None:
+                await asyncio.wait([session_start])
             try:
                 await self.pess_client.record_prompt_generated(
                     ticket_id=state['ticket_id'],
@@ -482,8 +490,7 @@ class JrDevGraph:
                 # Determine which memory service to use
                 if state.get('project_root'):
                     memory_root = os.path.join(state['project_root'], "syntheticMemory")
-                    memory_service = SyntheticMemory(root=memory_root, backend="fs")
-                    await memory_service.initialize()
+                    memory_service = await get_memory_service(memory_root)
                 else:
                     memory_service = self.synthetic_memory
 
@@ -5,14 +5,24 @@ The real LangGraph library exposes structured message handling utilities.
 Our workflow only needs to append messages into a list stored on the state.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 
-def add_messages(state: Dict[str, Any], messages: List[Any]) -> Dict[str, Any]:
-    """Append messages to ``state['messages']`` and return the updated state."""
+def add_messages(state: Dict[str, Any], messages: Union[List[Any], Any]) -> Dict[str, Any]:
+    """
+    Append messages to ``state['messages']`` in place and return the updated state.
+
+    ``messages`` may be a list or a single message. The state's list is
+    extended directly; ``setdefault`` is avoided because it would allocate a
+    throwaway empty list on every call once the key exists.
+    """
     if not messages:
         return state
-    state.setdefault("messages", [])
-    state["messages"].extend(messages)
+    if not isinstance(messages, list):
+        messages = [messages]
+    existing = state.get("messages")
+    if existing is None:
+        state["messages"] = list(messages)
+    else:
+        existing.extend(messages)
     return state
-
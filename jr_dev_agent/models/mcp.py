@@ -152,6 +152,7 @@ class PrepareAgentTaskArgs(BaseModel):
     user: Optional[str] = Field(None, description="User identifier/email for telemetry")
     project_root: Optional[str] = Field(None, description="Path to the project root directory (for memory storage)")
     fallback_template_content: Optional[str] = Field(None, description="Content of local fallback template file (e.g. jira_ticket_template.txt) if present on client")
+    fallback_template_path: Optional[str] = Field(None, description="Path to the fallback template file under the server's FALLBACK_TEMPLATE_ROOT; avoids sending its content inline")
 
     class Config:
         json_schema_extra = {
@@ -1,18 +1,44 @@
+import asyncio
+import inspect
 from typing import Any, Dict, List, Callable
 
 class ToolNode:
     """
     Stub for LangGraph ToolNode.
-    
+
     This class acts as a placeholder for the LangGraph ToolNode
     to ensure compatibility with existing imports.
     """
-    
+
     def __init__(self, tools: List[Callable]):
         self.tools = tools
-        
-    def __call__(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute the tools"""
-        # Stub implementation
+
+    async def __call__(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the tools.
+
+        Async so LangGraph runs the node on the event loop instead of handing
+        it to a worker thread. Tools that return an awaitable (async functions,
+        async ``__call__`` objects, partials of either) run concurrently; any
+        dict a tool returns is merged into ``state``, which is returned as-is.
+        """
+        if not self.tools:
+            return state
+
+        pending = []
+        for tool in self.tools:
+            result = tool(state)
+            if inspect.isawaitable(result):
+                pending.append(result)
+            else:
+                self._merge(state, result)
+
+        for update in await asyncio.gather(*pending):
+            self._merge(state, update)
+
         return state
 
+    @staticmethod
+    def _merge(state: Dict[str, Any], update: Any) -> None:
+        if isinstance(update, dict) and update is not state:
+            state.update(update)
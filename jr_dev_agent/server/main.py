@@ -20,6 +20,7 @@ from jr_dev_agent.models.session import SessionManager
 from jr_dev_agent.models.ticket import TicketMetadata
 from jr_dev_agent.models.prompt import PromptRequest, PromptResponse
 from jr_dev_agent.server.mcp_gateway import add_mcp_routes
+from jr_dev_agent.tools.create_template_pr import aclose_client as aclose_github_client
 
 # Configure logging
 logging.basicConfig(
@@ -269,6 +270,7 @@ async def shutdown_event():
     
     # Cleanup services
     await jr_dev_graph.cleanup()
+    await aclose_github_client()
     session_manager.cleanup()
     
     logger.info("✅ Jr Dev Agent MCP Server shutdown complete")
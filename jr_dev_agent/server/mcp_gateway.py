@@ -9,15 +9,19 @@ Usage:
     add_mcp_routes(app, jr_dev_graph, session_manager)
 """
 
+import asyncio
 import logging
-import json
-from typing import Dict, Any
+import re
+from typing import Any
 
+import anyio
+import orjson
 from fastapi import FastAPI
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, Response
+from fastapi.sse import EventSourceResponse, ServerSentEvent
 
 from jr_dev_agent.models.mcp import (
-    MCPRequest, MCPResponse, MCPToolDefinition, MCPErrorCodes,
+    MCPRequest, MCPToolDefinition, MCPErrorCodes,
     PrepareAgentTaskArgs, FinalizeSessionArgs, MCPInitializeResult,
     CreateTemplatePRArgs
 )
@@ -30,6 +34,24 @@ from jr_dev_agent.tools import (
 
 logger = logging.getLogger(__name__)
 
+# Mirrors the ticket_id pattern on PrepareAgentTaskArgs; checked up front so
+# malformed IDs are rejected before the full argument model is built.
+_TICKET_ID_RE = re.compile(r"^[A-Z]+-\d+$")
+
+
+class MCPJSONResponse(JSONResponse):
+    """
+    JSON-RPC response rendered with orjson.
+
+    Handlers return this directly so FastAPI skips ``jsonable_encoder`` and the
+    stdlib encoder on every call. (FastAPI's own ``ORJSONResponse`` is
+    deprecated in recent releases, hence the local subclass.)
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
 # MCP Tool Registry - Available tools for cross-IDE agents
 MCP_TOOLS = {
     "prepare_agent_task": MCPToolDefinition(
@@ -70,6 +92,10 @@ MCP_TOOLS = {
                 "fallback_template_content": {
                     "type": "string",
                     "description": "Content of local fallback template file (e.g. jira_ticket_template.txt) if present on client. The agent should read the file and pass its content here."
+                },
+                "fallback_template_path": {
+                    "type": "string",
+                    "description": "Path to the fallback template file, relative to or inside the server's FALLBACK_TEMPLATE_ROOT (disabled when unset). Preferred over fallback_template_content for large templates when the server shares the client's filesystem."
                 }
             },
             "required": ["ticket_id"]
@@ -180,6 +206,65 @@ MCP_PROMPTS = {
 }
 
 
+# Registries are static - serialize them once instead of per discovery request
+_TOOLS_RESULT_JSON = orjson.dumps({"tools": [tool.model_dump() for tool in MCP_TOOLS.values()]})
+_PROMPTS_RESULT_JSON = orjson.dumps({"prompts": list(MCP_PROMPTS.values())})
+
+
+# Discovery info for GET / - constant, so it's served as pre-encoded bytes
+_ROOT_INFO_JSON = orjson.dumps({
+    "name": "jrdev-gateway",
+    "version": "2.0.0",
+    "description": "Jr Dev Agent MCP Gateway",
+    "protocol": "mcp",
+    "capabilities": {
+        "tools": True,
+        "resources": False,
+        "prompts": True
+    },
+    "endpoints": {
+        "initialize": "POST /",
+        "tools_list": "POST /",
+        "tools_call": "POST /",
+        "mcp": "GET /mcp"
+    }
+})
+
+# Initial SSE frame; use endpoint='/mcp' to tell client to POST all JSON-RPC
+# messages to /mcp. Constant, so it's built once rather than per connection.
+_ENDPOINT_EVENT = ServerSentEvent(event="endpoint", raw_data="http://127.0.0.1:2323/mcp")
+
+# Tool name -> (argument model, invoker). Invokers share one signature so
+# mcp_call_tool dispatches with a single dict lookup.
+_TOOL_DISPATCH = {
+    "prepare_agent_task": (
+        PrepareAgentTaskArgs,
+        lambda args, graph, sessions: handle_prepare_agent_task(args, graph, sessions),
+    ),
+    "finalize_session": (
+        FinalizeSessionArgs,
+        lambda args, graph, sessions: handle_finalize_session(args, sessions, jr_dev_graph=graph),
+    ),
+    "create_template_pr": (
+        CreateTemplatePRArgs,
+        lambda args, graph, sessions: handle_create_template_pr(args),
+    ),
+    "health": (
+        None,
+        lambda args, graph, sessions: handle_health_tool(graph, sessions),
+    ),
+}
+
+
+def _prebuilt_success(id_value, result_json: bytes) -> Response:
+    """Splice an already-serialized result into a JSON-RPC success envelope."""
+    if id_value is None:
+        head = b'{"jsonrpc":"2.0","result":'
+    else:
+        head = b'{"jsonrpc":"2.0","id":' + orjson.dumps(id_value) + b',"result":'
+    return Response(content=head + result_json + b"}", media_type="application/json")
+
+
 def add_mcp_routes(app: FastAPI, jr_dev_graph, session_manager):
     """
     Add MCP protocol endpoints to existing FastAPI application
@@ -197,68 +282,37 @@ def add_mcp_routes(app: FastAPI, jr_dev_graph, session_manager):
         
         Returns server info and available endpoints.
         """
-        return {
-            "name": "jrdev-gateway",
-            "version": "2.0.0",
-            "description": "Jr Dev Agent MCP Gateway",
-            "protocol": "mcp",
-            "capabilities": {
-                "tools": True,
-                "resources": False,
-                "prompts": True
-            },
-            "endpoints": {
-                "initialize": "POST /",
-                "tools_list": "POST /",
-                "tools_call": "POST /",
-                "mcp": "GET /mcp"
-            }
-        }
+        return Response(content=_ROOT_INFO_JSON, media_type="application/json")
     
-    @app.get("/mcp")
-    @app.get("/mcp/sse")
+    @app.get("/mcp", response_class=EventSourceResponse)
+    @app.get("/mcp/sse", response_class=EventSourceResponse)
     async def mcp_endpoint():
         """
         MCP endpoint for Cursor MCP integration
         
         Keeps connection open and handles MCP protocol via server-sent events.
+        FastAPI frames the events and emits keep-alive pings while the stream
+        is idle, so the generator only has to announce the endpoint.
         """
-        async def event_generator():
-            # Send initial connection message
-            # Use endpoint='/mcp' to tell client to POST all JSON-RPC messages to /mcp
-            yield f"event: endpoint\ndata: http://127.0.0.1:2323/mcp\n\n"
-            
-            # Keep connection alive
-            import asyncio
-            try:
-                while True:
-                    await asyncio.sleep(30)
-                    yield f"event: ping\ndata: {json.dumps({'type': 'ping'})}\n\n"
-            except asyncio.CancelledError:
-                logger.info("MCP connection closed by client")
-                raise
-        
-        return StreamingResponse(
-            event_generator(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no"
-            }
-        )
+        yield _ENDPOINT_EVENT
+
+        try:
+            await anyio.sleep_forever()
+        except asyncio.CancelledError:
+            logger.info("MCP connection closed by client")
+            raise
     
     @app.post("/", response_model=None)
     @app.post("/mcp", response_model=None)  # Handle POST to /mcp as well to support fallback/defaults
-    async def mcp_root(request: MCPRequest) -> Dict[str, Any]:
+    async def mcp_root(request: MCPRequest) -> Response:
         """
         Root MCP endpoint for HTTP-based MCP clients
         
         Routes JSON-RPC requests to appropriate handlers.
         """
-        request_data = request.model_dump()
-        method = request_data.get("method")
-        logger.info(f"MCP root received method={method} request={request_data}")
+        method = request.method
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MCP root received method=%s request=%r", method, request)
         
         if method == "initialize":
             return await mcp_initialize(request)
@@ -273,27 +327,21 @@ def add_mcp_routes(app: FastAPI, jr_dev_graph, session_manager):
         else:
             return _error(request.id, MCPErrorCodes.METHOD_NOT_FOUND, f"Method not found: {method}")
     
+    # Envelopes are built as plain dicts: MCPResponse validation buys nothing for
+    # objects we construct ourselves. A null id is omitted, as exclude_none did.
     def _success(id_value, result):
-        response = MCPResponse(
-            jsonrpc="2.0",
-            id=id_value,
-            result=result
-        )
-        return response.model_dump(exclude_none=True)
+        if id_value is None:
+            return MCPJSONResponse(content={"jsonrpc": "2.0", "result": result})
+        return MCPJSONResponse(content={"jsonrpc": "2.0", "id": id_value, "result": result})
 
     def _error(id_value, code, message):
-        response = MCPResponse(
-            jsonrpc="2.0",
-            id=id_value,
-            error={
-                "code": code,
-                "message": message
-            }
-        )
-        return response.model_dump(exclude_none=True)
+        error = {"code": code, "message": message}
+        if id_value is None:
+            return MCPJSONResponse(content={"jsonrpc": "2.0", "error": error})
+        return MCPJSONResponse(content={"jsonrpc": "2.0", "id": id_value, "error": error})
 
     @app.post("/mcp/initialize", response_model=None)
-    async def mcp_initialize(request: MCPRequest) -> Dict[str, Any]:
+    async def mcp_initialize(request: MCPRequest) -> MCPJSONResponse:
         """
         MCP initialization and capability negotiation
         """
@@ -309,23 +357,21 @@ def add_mcp_routes(app: FastAPI, jr_dev_graph, session_manager):
             return _error(request.id, MCPErrorCodes.INTERNAL_ERROR, f"Initialization failed: {str(e)}")
 
     @app.post("/mcp/tools/list", response_model=None)
-    async def mcp_list_tools(request: MCPRequest) -> Dict[str, Any]:
+    async def mcp_list_tools(request: MCPRequest) -> Response:
         """
         MCP tool discovery endpoint
         """
         try:
             logger.info("MCP tools list requested")
             
-            tools = [tool.model_dump() for tool in MCP_TOOLS.values()]
-            
-            return _success(request.id, {"tools": tools})
+            return _prebuilt_success(request.id, _TOOLS_RESULT_JSON)
             
         except Exception as e:
             logger.error(f"Error listing MCP tools: {str(e)}")
             return _error(request.id, MCPErrorCodes.INTERNAL_ERROR, f"Failed to list tools: {str(e)}")
 
     @app.post("/mcp/tools/call", response_model=None)
-    async def mcp_call_tool(request: MCPRequest) -> Dict[str, Any]:
+    async def mcp_call_tool(request: MCPRequest) -> MCPJSONResponse:
         """
         MCP tool execution endpoint
         """
@@ -336,29 +382,25 @@ def add_mcp_routes(app: FastAPI, jr_dev_graph, session_manager):
             tool_name = request.params.get("name")
             arguments = request.params.get("arguments", {})
             
-            logger.info(f"MCP tool call: {tool_name} with args: {arguments}")
+            logger.info("MCP tool call: %s with args: %s", tool_name, arguments)
             
             # Route to appropriate tool handler
-            if tool_name == "prepare_agent_task":
-                result = await handle_prepare_agent_task(
-                    PrepareAgentTaskArgs(**arguments),
-                    jr_dev_graph,
-                    session_manager
-                )
-            elif tool_name == "finalize_session":
-                result = await handle_finalize_session(
-                    FinalizeSessionArgs(**arguments),
-                    session_manager,
-                    jr_dev_graph=jr_dev_graph
-                )
-            elif tool_name == "create_template_pr":
-                result = await handle_create_template_pr(
-                    CreateTemplatePRArgs(**arguments)
-                )
-            elif tool_name == "health":
-                result = await handle_health_tool(jr_dev_graph, session_manager)
-            else:
+            entry = _TOOL_DISPATCH.get(tool_name)
+            if entry is None:
                 return _error(request.id, MCPErrorCodes.TOOL_NOT_FOUND, f"Tool not found: {tool_name}")
+
+            if tool_name == "prepare_agent_task":
+                ticket_id = arguments.get("ticket_id")
+                if not isinstance(ticket_id, str) or not _TICKET_ID_RE.match(ticket_id):
+                    return _error(
+                        request.id,
+                        MCPErrorCodes.INVALID_PARAMS,
+                        f"Invalid parameters: ticket_id must match {_TICKET_ID_RE.pattern}",
+                    )
+
+            args_model, invoke = entry
+            args = args_model.model_validate(arguments) if args_model is not None else None
+            result = await invoke(args, jr_dev_graph, session_manager)
             
             return _success(request.id, result)
             
@@ -372,18 +414,17 @@ def add_mcp_routes(app: FastAPI, jr_dev_graph, session_manager):
             return _error(request.id, MCPErrorCodes.TOOL_EXECUTION_ERROR, f"Tool execution failed: {str(e)}")
 
     @app.post("/mcp/prompts/list", response_model=None)
-    async def mcp_list_prompts(request: MCPRequest) -> Dict[str, Any]:
+    async def mcp_list_prompts(request: MCPRequest) -> Response:
         """List available prompts"""
         try:
             logger.info("MCP prompts list requested")
-            prompts = list(MCP_PROMPTS.values())
-            return _success(request.id, {"prompts": prompts})
+            return _prebuilt_success(request.id, _PROMPTS_RESULT_JSON)
         except Exception as e:
             logger.error(f"Error listing prompts: {str(e)}")
             return _error(request.id, MCPErrorCodes.INTERNAL_ERROR, f"Failed to list prompts: {str(e)}")
 
     @app.post("/mcp/prompts/get", response_model=None)
-    async def mcp_get_prompt(request: MCPRequest) -> Dict[str, Any]:
+    async def mcp_get_prompt(request: MCPRequest) -> MCPJSONResponse:
         """Get a specific prompt"""
         try:
             if not request.params:
@@ -392,7 +433,7 @@ def add_mcp_routes(app: FastAPI, jr_dev_graph, session_manager):
             prompt_name = request.params.get("name")
             arguments = request.params.get("arguments", {})
             
-            logger.info(f"MCP prompt get: {prompt_name} with args: {arguments}")
+            logger.info("MCP prompt get: %s with args: %s", prompt_name, arguments)
             
             if prompt_name == "prepare_agent_task":
                 # Reuse the tool logic!
@@ -401,7 +442,8 @@ def add_mcp_routes(app: FastAPI, jr_dev_graph, session_manager):
                     repo=arguments.get("repo"),
                     branch=arguments.get("branch"),
                     project_root=arguments.get("project_root"),
-                    fallback_template_content=arguments.get("fallback_template_content")
+                    fallback_template_content=arguments.get("fallback_template_content"),
+                    fallback_template_path=arguments.get("fallback_template_path")
                 )
                 
                 # Call the shared logic
@@ -6,12 +6,183 @@ Integrates into the LangGraph workflow for context enrichment.
 """
 
 import os
+import re
+import mmap
 import json
 import time
+import heapq
+import asyncio
 import logging
-from typing import List, Dict, Any
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
+import orjson
+
+
+# Service config, resolved relative to the working directory
+_CONFIG_PATH = "config.json"
+
+# File references in free-text descriptions, matched by common source extensions
+_FILE_REF_RE = re.compile(r'\b[\w\-\.\/]+\.(?:ts|js|tsx|jsx|py|java|graphql|json|yml|yaml)\b')
+
+# File classification bits, computed once per file by _classify_files
+_FLAG_RESOLVER = 1 << 0
+_FLAG_GRAPHQL = 1 << 1       # ".graphql" anywhere in the name
+_FLAG_GRAPHQL_EXT = 1 << 2   # name ends with ".graphql"
+_FLAG_TEST = 1 << 3
+_FLAG_CONFIG = 1 << 4
+_FLAG_SHIPPING = 1 << 5
+_FLAG_PFS = 1 << 6
+_FLAG_SLA = 1 << 7
+_FLAG_CCM = 1 << 8
+
+# Connected feature emitted for each classification bit
+_FEATURE_FLAGS = (
+    (_FLAG_SHIPPING, "shipping"),
+    (_FLAG_PFS, "pfs"),
+    (_FLAG_SLA, "sla"),
+    (_FLAG_CONFIG, "configuration"),
+    (_FLAG_RESOLVER, "graphql_resolvers"),
+    (_FLAG_GRAPHQL, "graphql_schema"),
+)
+
+# Complexity multiplier applied when any file carries the bit
+_COMPLEXITY_MULTIPLIERS = (
+    (_FLAG_RESOLVER, 1.2),
+    (_FLAG_GRAPHQL, 1.3),
+    (_FLAG_CONFIG, 1.1),
+    (_FLAG_TEST, 0.9),  # Tests reduce perceived complexity
+)
+_COMPLEXITY_MASK = sum(flag for flag, _ in _COMPLEXITY_MULTIPLIERS)
+
+
+def _complexity_product(mask: int) -> float:
+    product = 1.0
+    for flag, mult in _COMPLEXITY_MULTIPLIERS:
+        if mask & flag:
+            product *= mult
+    return product
+
+
+# Combined multiplier for every subset of the complexity bits, so scoring is a
+# single lookup on the OR of a ticket's file flags
+_COMPLEXITY_LUT = {
+    mask: _complexity_product(mask)
+    for mask in range(_COMPLEXITY_MASK + 1)
+    if mask & ~_COMPLEXITY_MASK == 0
+}
+
+# File hint for each classification, in priority order
+_FILE_HINT_NOTES = (
+    (_FLAG_CCM, "CCM pattern lives here; do not modify unrelated flags."),
+    (_FLAG_RESOLVER, "GraphQL resolver - maintain existing patterns and add feature flag guards."),
+    (_FLAG_TEST, "Add test coverage for new functionality with CCM flag variations."),
+)
+
+# Files that make up a ticket's memory pack
+_PACK_FILES = ("graph.json", "files.json", "agent_run.json")
+# Keys of a pack file that enrichment actually reads; the rest of the document
+# (agent_run.json carries the full prompt and LLM summaries) is not kept
+_PACK_FIELDS = {
+    "agent_run.json": ("result", "pr_url", "pess_score", "template_name", "completion_timestamp"),
+}
+# Pack files are machine-read, so they are written compact (README.md is the
+# human-readable view); numpy scalars (e.g. PESS scores) serialize natively
+_JSON_OPTS = orjson.OPT_SERIALIZE_NUMPY
+# Prior runs surfaced in a MemoryEnvelope
+MAX_PRIOR_RUNS = 5
+# Parsed pack files kept per service instance
+PACK_CACHE_MAXSIZE = 2048
+# Per-project memory services kept initialized across requests
+MEMORY_SERVICE_CACHE_MAXSIZE = 16
+# Pack files at least this large are parsed straight from a read-only mapping;
+# below it a plain read() is cheaper than setting up the mapping
+MMAP_MIN_SIZE = 64 * 1024
+
+# Serializes read-modify-write of ticket index files across the worker threads
+# of every SyntheticMemory in this process (instances can share a root)
+_TICKET_INDEX_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _load_memory_config(path: str, mtime_ns: int) -> Tuple[str, Optional[str]]:
+    """
+    Read the memory section of a config file.
+
+    Cached per ``(path, mtime_ns)`` so every SyntheticMemory instance in the
+    process shares one parse until the file changes.
+
+    Returns:
+        tuple: (backend, fs root_dir or None)
+    """
+    with open(path, "r") as f:
+        config = json.load(f)
+    memory_config = config.get("memory", {})
+    return memory_config.get("backend", "fs"), memory_config.get("fs", {}).get("root_dir")
+
+
+def _list_subdirs(path: Path) -> List[Path]:
+    """List the immediate subdirectories of ``path`` with a single scandir pass."""
+    with os.scandir(path) as it:
+        return [Path(entry.path) for entry in it if entry.is_dir()]
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write ``data`` to ``path`` so readers see either the old file or the new one, never a partial write."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _read_json(path: str, size: int) -> Any:
+    """Parse the JSON file at ``path``, mapping it instead of copying it when it is large."""
+    with open(path, "rb") as f:
+        if size < MMAP_MIN_SIZE:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _classify_files(files: List[str]) -> List[Tuple[str, int]]:
+    """Tag each file with its classification bits in a single pass."""
+    classified = []
+    for f in files:
+        low = f.lower()
+        flags = 0
+        if "resolver" in low:
+            flags |= _FLAG_RESOLVER
+        if ".graphql" in f:
+            flags |= _FLAG_GRAPHQL
+            if f.endswith(".graphql"):
+                flags |= _FLAG_GRAPHQL_EXT
+        if "test" in low:
+            flags |= _FLAG_TEST
+        if "config" in low:
+            flags |= _FLAG_CONFIG
+        if "shipping" in low:
+            flags |= _FLAG_SHIPPING
+        if "pfs" in low:
+            flags |= _FLAG_PFS
+        if "sla" in low:
+            flags |= _FLAG_SLA
+        if "ccm" in low or "setup-runtime-config" in f:
+            flags |= _FLAG_CCM
+        classified.append((f, flags))
+    return classified
+
 
 class SyntheticMemory:
     """
@@ -33,6 +204,10 @@ class SyntheticMemory:
         self.root = root
         self.backend = backend
         self.initialized = False
+        # Parsed pack files: path -> (st_mtime_ns, st_size, document)
+        self._pack_cache: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+        # Packs are loaded from worker threads
+        self._pack_cache_lock = threading.Lock()
         
     async def initialize(self):
         """Initialize the synthetic memory service"""
@@ -40,19 +215,17 @@ class SyntheticMemory:
         
         # Load config if available
         try:
-            with open("config.json", "r") as f:
-                config = json.load(f)
-                memory_config = config.get("memory", {})
-                self.backend = memory_config.get("backend", "fs")
-                if self.backend == "fs":
-                    # Only override root if it wasn't explicitly set in __init__ (default is "syntheticMemory")
-                    # or if we want config to take precedence over default but not over explicit override.
-                    # Simpler check: if self.root is still the default, use config.
-                    config_root = memory_config.get("fs", {}).get("root_dir")
-                    if config_root and self.root == "syntheticMemory":
-                        self.root = config_root
+            st = os.stat(_CONFIG_PATH)
         except FileNotFoundError:
             pass  # Use defaults
+        else:
+            self.backend, config_root = _load_memory_config(_CONFIG_PATH, st.st_mtime_ns)
+            if self.backend == "fs":
+                # Only override root if it wasn't explicitly set in __init__ (default is "syntheticMemory")
+                # or if we want config to take precedence over default but not over explicit override.
+                # Simpler check: if self.root is still the default, use config.
+                if config_root and self.root == "syntheticMemory":
+                    self.root = config_root
             
         # Ensure root directory exists
         os.makedirs(self.root, exist_ok=True)
@@ -85,19 +258,20 @@ class SyntheticMemory:
             
             # Step 1: Identify feature scope
             feature_id, files_referenced = self._identify_feature_scope(ticket_data)
+            classified = _classify_files(files_referenced)
             
             # ENHANCEMENT: Create memory for current ticket (preserving original logic)
-            current_memory = await self._enrich_memory(ticket_id, feature_id, files_referenced)
+            current_memory = await self._enrich_memory(ticket_id, feature_id, files_referenced, classified)
             self.logger.info(f"Created memory structures for current ticket {ticket_id}")
             
             # Step 2: Locate memory packs (for context from prior runs)
-            memory_packs = self._locate_memory_packs(feature_id)
+            memory_packs = await self._locate_memory_packs(feature_id)
             
             # Step 3: Score & select relevant runs
             relevant_runs = self._score_and_select(memory_packs, files_referenced, ticket_data)
             
             # Step 4: Assemble MemoryEnvelope (enhancement for context enrichment)
-            memory_envelope = self._assemble_memory_envelope(feature_id, relevant_runs, files_referenced, ticket_data)
+            memory_envelope = self._assemble_memory_envelope(feature_id, relevant_runs, classified, ticket_data)
             
             # Step 5: Return enriched context combining original + enhanced logic
             return {
@@ -117,7 +291,9 @@ class SyntheticMemory:
             ticket_id = ticket_data.get("ticket_id", "unknown")
             try:
                 feature_id, files_referenced = self._identify_feature_scope(ticket_data)
-                current_memory = await self._enrich_memory(ticket_id, feature_id, files_referenced)
+                current_memory = await self._enrich_memory(
+                    ticket_id, feature_id, files_referenced, _classify_files(files_referenced)
+                )
                 self.logger.info(f"Created basic memory structures for {ticket_id} despite enrichment error")
             except:
                 current_memory = {"related_nodes": {}, "connected_features": [], "complexity_score": 0.5}
@@ -165,7 +341,7 @@ class SyntheticMemory:
             
         return feature_id, files_referenced
     
-    def _locate_memory_packs(self, feature_id: str) -> List[Dict]:
+    async def _locate_memory_packs(self, feature_id: str) -> List[Dict]:
         """
         Step 2: Locate memory packs
         
@@ -181,25 +357,75 @@ class SyntheticMemory:
             
         feature_path = Path(self.root) / "features" / feature_id
         
-        if not feature_path.exists():
+        # Find all ticket directories under this feature, then load their packs concurrently
+        try:
+            ticket_dirs = await asyncio.to_thread(_list_subdirs, feature_path)
+        except FileNotFoundError:
             self.logger.info(f"No memory packs found for feature: {feature_id}")
             return memory_packs
-            
-        # Find all ticket directories under this feature
+        except Exception as e:
+            self.logger.warning(f"Error scanning memory packs for {feature_id}: {str(e)}")
+            return memory_packs
+
         try:
-            for ticket_dir in feature_path.iterdir():
-                if ticket_dir.is_dir():
-                    pack = self._load_memory_pack(ticket_dir)
-                    if pack:
-                        memory_packs.append(pack)
+            packs = await asyncio.gather(
+                *(asyncio.to_thread(self._load_memory_pack, d) for d in ticket_dirs)
+            )
+            memory_packs = [pack for pack in packs if pack]
         except Exception as e:
             self.logger.warning(f"Error scanning memory packs for {feature_id}: {str(e)}")
             
         return memory_packs
     
+    def _load_json_batch(self, entries: List[os.DirEntry]) -> Dict[str, Any]:
+        """
+        Load a batch of small JSON files found by ``os.scandir``.
+
+        Parsed documents are cached by path and reused while the file's
+        ``(st_mtime_ns, st_size)`` is unchanged, so a warm lookup costs one
+        stat() instead of a read and a parse.
+
+        Returns:
+            Mapping of file name -> parsed document for every file that could be loaded
+        """
+        loaded = {}
+        for entry in entries:
+            try:
+                st = entry.stat()
+            except OSError as e:
+                self.logger.warning(f"Error opening {entry.path}: {str(e)}")
+                continue
+
+            key = entry.path
+            with self._pack_cache_lock:
+                cached = self._pack_cache.get(key)
+                if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    self._pack_cache.move_to_end(key)
+                    loaded[entry.name] = cached[2]
+                    continue
+
+            try:
+                data = _read_json(entry.path, st.st_size)
+                fields = _PACK_FIELDS.get(entry.name)
+                if fields is not None and isinstance(data, dict):
+                    # Drop what scoring never reads (e.g. full_prompt) before caching
+                    data = {k: data[k] for k in fields if k in data}
+            except Exception as e:
+                self.logger.warning(f"Error loading {entry.name} from {os.path.dirname(entry.path)}: {str(e)}")
+                continue
+
+            with self._pack_cache_lock:
+                self._pack_cache[key] = (st.st_mtime_ns, st.st_size, data)
+                if len(self._pack_cache) > PACK_CACHE_MAXSIZE:
+                    self._pack_cache.popitem(last=False)
+            loaded[entry.name] = data
+        return loaded
+
     def _load_memory_pack(self, ticket_dir: Path) -> Dict:
         """
         Load a complete memory pack from a ticket directory.
+
+        Blocking; ``_locate_memory_packs`` runs it in a worker thread.
         
         Returns:
             Memory pack with summary, graph, files, and agent_run data
@@ -208,18 +434,29 @@ class SyntheticMemory:
             "ticket_id": ticket_dir.name,
             "directory": str(ticket_dir)
         }
+        # One directory read tells us which pack files exist
+        try:
+            with os.scandir(ticket_dir) as it:
+                present = [e for e in it if e.name in _PACK_FILES and e.is_file()]
+        except OSError as e:
+            self.logger.warning(f"Error reading memory pack {ticket_dir}: {str(e)}")
+            return None
+        loaded = self._load_json_batch(present)
         
-        # Load each file if it exists
-        for filename in ["graph.json", "files.json", "agent_run.json"]:
-            file_path = ticket_dir / filename
-            if file_path.exists():
-                try:
-                    with open(file_path, 'r') as f:
-                        pack[filename.replace('.json', '')] = json.load(f)
-                except Exception as e:
-                    self.logger.warning(f"Error loading {filename} from {ticket_dir}: {str(e)}")
-                    
-        return pack if len(pack) > 2 else None  # Must have more than just ticket_id and directory
+        # Attach each file that was found
+        for filename in _PACK_FILES:
+            if filename in loaded:
+                pack[filename.replace('.json', '')] = loaded[filename]
+
+        if len(pack) <= 2:
+            return None  # Must have more than just ticket_id and directory
+
+        # Normalize file entries once for scoring and run data
+        files_doc = pack.get("files")
+        raw_files = files_doc.get("files", []) if isinstance(files_doc, dict) else []
+        pack["_file_names"] = tuple(f.get("name", str(f)) if isinstance(f, dict) else str(f) for f in raw_files)
+        pack["_files_set"] = frozenset(pack["_file_names"])
+        return pack
     
     def _score_and_select(self, memory_packs: List[Dict], files_referenced: List[str], ticket_data: Dict) -> List[Dict]:
         """
@@ -234,50 +471,51 @@ class SyntheticMemory:
         if not memory_packs:
             return []
             
-        scored_runs = []
+        scored_packs = []
         template_type = ticket_data.get('template_name', 'unknown')
         current_time = time.time()
         
+        ref_set = frozenset(files_referenced)
         for pack in memory_packs:
-            score = self._calculate_relevance_score(pack, files_referenced, template_type, current_time)
+            score = self._calculate_relevance_score(pack, ref_set, template_type, current_time)
             if score > 0:  # Only include relevant runs
-                # Extract file names from pack files
-                pack_files = pack.get("files", {}).get("files", [])
-                files_list = [f.get("name", str(f)) if isinstance(f, dict) else str(f) for f in pack_files]
-                
-                run_data = {
-                    "ticket_id": pack["ticket_id"],
-                    "score": score,
-                    "files_touched": files_list,
-                    "result": pack.get("agent_run", {}).get("result", "unknown"),
-                    "pr_url": pack.get("agent_run", {}).get("pr_url"),
-                    "pess_score": pack.get("agent_run", {}).get("pess_score"),
-                    "related_nodes": pack.get("graph", {}).get("related_nodes", {}),
-                    "connected_features": pack.get("graph", {}).get("connected_features", []),
-                    "complexity_score": pack.get("graph", {}).get("complexity_score", 0.5)
-                }
-                scored_runs.append(run_data)
-        
-        # Sort by score (descending) and return top N (default 5)
-        scored_runs.sort(key=lambda x: x["score"], reverse=True)
-        return scored_runs[:5]
+                scored_packs.append((score, pack))
+        
+        # Keep the top N by score (descending; ties keep scan order), then build run data only for those
+        scored_runs = []
+        for score, pack in heapq.nlargest(MAX_PRIOR_RUNS, scored_packs, key=itemgetter(0)):
+            run_data = {
+                "ticket_id": pack["ticket_id"],
+                "score": score,
+                "files_touched": list(pack["_file_names"]),
+                "result": pack.get("agent_run", {}).get("result", "unknown"),
+                "pr_url": pack.get("agent_run", {}).get("pr_url"),
+                "pess_score": pack.get("agent_run", {}).get("pess_score"),
+                "related_nodes": pack.get("graph", {}).get("related_nodes", {}),
+                "connected_features": pack.get("graph", {}).get("connected_features", []),
+                "complexity_score": pack.get("graph", {}).get("complexity_score", 0.5)
+            }
+            scored_runs.append(run_data)
+        
+        return scored_runs
     
-    def _calculate_relevance_score(self, pack: Dict, files_referenced: List[str], template_type: str, current_time: float) -> float:
+    def _calculate_relevance_score(self, pack: Dict, ref_set: frozenset, template_type: str, current_time: float) -> float:
         """
         Calculate relevance score using: w1*file_overlap + w2*recency + w3*same_template_type
+
+        Args:
+            pack: Memory pack from ``_load_memory_pack`` (carries its precomputed file set)
+            ref_set: Files referenced by the current ticket, built once per selection
         
         Returns:
             Relevance score (0.0 to 1.0)
         """
-        # Extract pack files
-        pack_files = []
-        if "files" in pack and "files" in pack["files"]:
-            pack_files = [f.get("name", "") if isinstance(f, dict) else str(f) for f in pack["files"]["files"]]
+        pack_file_count = len(pack["_file_names"])
         
         # Calculate file overlap (w1 = 0.5)
-        if files_referenced and pack_files:
-            overlap = len(set(files_referenced) & set(pack_files))
-            max_files = max(len(files_referenced), len(pack_files))
+        if ref_set and pack_file_count:
+            overlap = len(ref_set & pack["_files_set"])
+            max_files = max(len(ref_set), pack_file_count)
             file_overlap_score = overlap / max_files if max_files > 0 else 0
         else:
             file_overlap_score = 0
@@ -312,7 +550,7 @@ class SyntheticMemory:
         relevance_score = (0.5 * file_overlap_score) + (0.3 * recency_score) + (0.2 * template_score)
         return min(1.0, relevance_score)
     
-    def _assemble_memory_envelope(self, feature_id: str, relevant_runs: List[Dict], files_referenced: List[str], ticket_data: Dict) -> Dict:
+    def _assemble_memory_envelope(self, feature_id: str, relevant_runs: List[Dict], classified: List[Tuple[str, int]], ticket_data: Dict) -> Dict:
         """
         Step 4: Assemble MemoryEnvelope
         
@@ -323,7 +561,7 @@ class SyntheticMemory:
         """
         # Aggregate related nodes from all relevant runs
         related_nodes = {}
-        connected_features = set()
+        connected_features = {}  # ordered set
         complexity_scores = []
         
         for run in relevant_runs:
@@ -336,7 +574,7 @@ class SyntheticMemory:
                     
             # Collect connected features
             if run.get("connected_features"):
-                connected_features.update(run["connected_features"])
+                connected_features.update(dict.fromkeys(run["connected_features"]))
                 
             # Collect complexity scores
             if run.get("complexity_score"):
@@ -344,13 +582,13 @@ class SyntheticMemory:
         
         # Deduplicate related_nodes connections
         for node in related_nodes:
-            related_nodes[node] = list(set(related_nodes[node]))
+            related_nodes[node] = list(dict.fromkeys(related_nodes[node]))
         
         # Calculate aggregate complexity score
         avg_complexity = sum(complexity_scores) / len(complexity_scores) if complexity_scores else 0.5
         
         # Generate file hints based on files and prior runs
-        file_hints = self._generate_file_hints(files_referenced, relevant_runs)
+        file_hints = self._generate_file_hints(classified, relevant_runs)
         
         # Format prior runs for the envelope
         prior_runs = []
@@ -373,60 +611,36 @@ class SyntheticMemory:
             "complexity_score": round(avg_complexity, 2)
         }
     
-    def _generate_file_hints(self, files_referenced: List[str], relevant_runs: List[Dict]) -> List[Dict]:
+    def _generate_file_hints(self, classified: List[Tuple[str, int]], relevant_runs: List[Dict]) -> List[Dict]:
         """
         Generate file hints based on files and prior run patterns.
         
         Returns:
             List of file hints with path and note
         """
-        file_hints = []
-        
-        # Group files by common patterns from prior runs
-        ccm_files = [f for f in files_referenced if "setup-runtime-config" in f or "ccm" in f.lower()]
-        resolver_files = [f for f in files_referenced if "resolver" in f.lower()]
-        test_files = [f for f in files_referenced if "test" in f.lower()]
-        
-        # Generate hints based on file types and prior run learnings
-        for ccm_file in ccm_files:
-            file_hints.append({
-                "path": ccm_file,
-                "note": "CCM pattern lives here; do not modify unrelated flags."
-            })
-            
-        for resolver_file in resolver_files:
-            file_hints.append({
-                "path": resolver_file, 
-                "note": "GraphQL resolver - maintain existing patterns and add feature flag guards."
-            })
-            
-        for test_file in test_files:
-            file_hints.append({
-                "path": test_file,
-                "note": "Add test coverage for new functionality with CCM flag variations."
-            })
+        # First hint per path wins: CCM, then resolver, then test, then prior runs
+        hints_by_path = {}
+        for f, flags in classified:
+            for flag, note in _FILE_HINT_NOTES:
+                if flags & flag:
+                    hints_by_path[f] = {"path": f, "note": note}
+                    break
             
         # Add hints from prior run patterns
+        files_referenced = frozenset(f for f, _ in classified)
         for run in relevant_runs:
             if run.get("result") == "merged" and run.get("files_touched"):
                 for touched_file in run["files_touched"]:
-                    if touched_file in files_referenced:
-                        file_hints.append({
+                    if touched_file in files_referenced and touched_file not in hints_by_path:
+                        hints_by_path[touched_file] = {
                             "path": touched_file,
                             "note": f"Previously modified in {run['ticket_id']} (merged successfully)"
-                        })
-        
-        # Deduplicate hints by path
-        seen_paths = set()
-        unique_hints = []
-        for hint in file_hints:
-            if hint["path"] not in seen_paths:
-                unique_hints.append(hint)
-                seen_paths.add(hint["path"])
+                        }
                 
-        return unique_hints
+        return list(hints_by_path.values())
     
-    async def _enrich_memory(self, ticket_id: str, feature_id: str, files_referenced: List[str]) -> Dict:
+    async def _enrich_memory(self, ticket_id: str, feature_id: str, files_referenced: List[str],
+                             classified: List[Tuple[str, int]]) -> Dict:
         """
         Core memory enrichment logic.
         
@@ -434,6 +648,7 @@ class SyntheticMemory:
             ticket_id: Jira ticket ID
             feature_id: Feature identifier
             files_referenced: List of file names
+            classified: ``files_referenced`` tagged by ``_classify_files``
         
         Returns:
             Memory enrichment data with related_nodes, connected_features, complexity_score
@@ -448,28 +663,24 @@ class SyntheticMemory:
         
         # Create filesystem structure
         feature_dir = os.path.join(self.root, "features", feature_id, ticket_id)
-        os.makedirs(feature_dir, exist_ok=True)
+        await asyncio.to_thread(os.makedirs, feature_dir, exist_ok=True)
         
         # Create files.json
         files_json = {
             "files": [{"name": f, "size": None, "hash": None} for f in files_referenced],
             "created_at": time.time()
         }
-        with open(os.path.join(feature_dir, "files.json"), "w") as f:
-            json.dump(files_json, f, indent=2)
         
         # Create graph.json with heuristic relationships
-        related_nodes = self._heuristic_links(files_referenced)
-        connected_features = self._find_connected_features(feature_id, files_referenced)
-        complexity_score = self._calculate_complexity(files_referenced)
+        related_nodes = self._heuristic_links(classified)
+        connected_features = self._find_connected_features(feature_id, classified)
+        complexity_score = self._calculate_complexity(classified)
         
         graph_json = {
             "related_nodes": related_nodes,
             "connected_features": connected_features,
             "complexity_score": complexity_score
         }
-        with open(os.path.join(feature_dir, "graph.json"), "w") as f:
-            json.dump(graph_json, f, indent=2)
         
         # Create agent_run.json (initial)
         agent_run_json = {
@@ -478,19 +689,16 @@ class SyntheticMemory:
             "created_at": time.time(),
             "status": "started"
         }
-        with open(os.path.join(feature_dir, "agent_run.json"), "w") as f:
-            json.dump(agent_run_json, f, indent=2)
         
         # Create embeddings.jsonl (stub for now)
-        embeddings_file = os.path.join(feature_dir, "embeddings.jsonl")
-        with open(embeddings_file, "w") as f:
-            for file_name in files_referenced:
-                embedding_entry = {
-                    "file": file_name,
-                    "text_hash": None,
-                    "embedding": None  # Stub for MVP
-                }
-                f.write(json.dumps(embedding_entry) + "\n")
+        embeddings = b"".join(
+            orjson.dumps({
+                "file": file_name,
+                "text_hash": None,
+                "embedding": None  # Stub for MVP
+            }) + b"\n"
+            for file_name in files_referenced
+        )
         
         # Create README.md for human context
         readme_content = f"""# {feature_id} - {ticket_id}
@@ -513,8 +721,27 @@ This directory contains synthetic memory for the {feature_id} feature implementa
 ---
 Generated by Jr Dev Agent v2 Synthetic Memory
 """
-        with open(os.path.join(feature_dir, "README.md"), "w") as f:
-            f.write(readme_content)
+        
+        # Write every file off the event loop, concurrently; each lands via an atomic rename
+        targets = (
+            ("files.json", orjson.dumps(files_json, option=_JSON_OPTS)),
+            ("graph.json", orjson.dumps(graph_json, option=_JSON_OPTS)),
+            ("agent_run.json", orjson.dumps(agent_run_json, option=_JSON_OPTS)),
+            ("embeddings.jsonl", embeddings),
+            ("README.md", readme_content.encode("utf-8")),
+        )
+        await asyncio.gather(
+            asyncio.to_thread(self._index_ticket, ticket_id, feature_id),
+            *(
+                asyncio.to_thread(_write_atomic, os.path.join(feature_dir, name), payload)
+                for name, payload in targets
+            ),
+        )
+
+        # Pack files were just rewritten; don't trust an mtime that may not have ticked
+        with self._pack_cache_lock:
+            for filename in _PACK_FILES:
+                self._pack_cache.pop(str(Path(feature_dir) / filename), None)
         
         # Return enrichment data
         return {
@@ -544,14 +771,10 @@ Generated by Jr Dev Agent v2 Synthetic Memory
         description = ticket_data.get("description", "")
         if description:
             # Simple pattern matching for common file extensions
-            import re
-            file_patterns = r'\b[\w\-\.\/]+\.(?:ts|js|tsx|jsx|py|java|graphql|json|yml|yaml)\b'
-            found_files = re.findall(file_patterns, description)
-            files.extend(found_files)
-        
-        # Remove duplicates and normalize
-        files = list(set(files))
-        return [f for f in files if f.strip()]
+            files.extend(_FILE_REF_RE.findall(description))
+        
+        # Remove blanks and duplicates, keeping first-seen order
+        return list(dict.fromkeys(f for f in files if f.strip()))
     
     def _determine_feature_id(self, ticket_data: Dict[str, Any], files: List[str]) -> str:
         """Determine feature ID from ticket data and files"""
@@ -577,17 +800,14 @@ Generated by Jr Dev Agent v2 Synthetic Memory
         # Default fallback
         return "new_feature"
     
-    def _heuristic_links(self, files: List[str]) -> Dict:
+    def _heuristic_links(self, classified: List[Tuple[str, int]]) -> Dict:
         """Create heuristic relationships between files"""
         # Group files by directory and type
         dirs = {}
-        for f in files:
+        for f, _ in classified:
             # Extract directory-like info from filename
-            if "/" in f:
-                dir_part = "/".join(f.split("/")[:-1])
-            else:
-                dir_part = "."
-            dirs.setdefault(dir_part, []).append(f.split("/")[-1])
+            dir_part, sep, base = f.rpartition("/")
+            dirs.setdefault(dir_part if sep else ".", []).append(base)
         
         related = {}
         for group in dirs.values():
@@ -595,70 +815,43 @@ Generated by Jr Dev Agent v2 Synthetic Memory
                 related[f] = [x for x in group if x != f]
         
         # Add type-based relationships
-        resolvers = [f for f in files if "resolver" in f.lower()]
-        schemas = [f for f in files if f.endswith(".graphql")]
-        tests = [f for f in files if "test" in f.lower()]
+        resolvers = [f for f, flags in classified if flags & _FLAG_RESOLVER]
+        schemas = [f for f, flags in classified if flags & _FLAG_GRAPHQL_EXT]
+        tests = [f for f, flags in classified if flags & _FLAG_TEST]
         
         # Link resolvers to schemas
         for resolver in resolvers:
             related.setdefault(resolver, []).extend(schemas)
         
         # Link tests to implementation files
-        for test in tests:
-            impl_files = [f for f in files if f not in tests and "test" not in f.lower()]
-            related.setdefault(test, []).extend(impl_files)
+        if tests:
+            impl_files = [f for f, flags in classified if not flags & _FLAG_TEST]
+            for test in tests:
+                related.setdefault(test, []).extend(impl_files)
         
         return related
     
-    def _find_connected_features(self, current_feature: str, files: List[str]) -> List[str]:
+    def _find_connected_features(self, current_feature: str, classified: List[Tuple[str, int]]) -> List[str]:
         """Find connected features based on file patterns"""
-        features = []
-        
-        # Extract features from file names
-        for f in files:
-            # Common patterns
-            if "shipping" in f.lower():
-                features.append("shipping")
-            if "pfs" in f.lower():
-                features.append("pfs")
-            if "sla" in f.lower():
-                features.append("sla")
-            if "config" in f.lower():
-                features.append("configuration")
-            if "resolver" in f.lower():
-                features.append("graphql_resolvers")
-            if ".graphql" in f:
-                features.append("graphql_schema")
-        
-        # Remove duplicates and current feature
-        features = list(set(features))
-        if current_feature in features:
-            features.remove(current_feature)
-        
-        return features
+        mask = 0
+        for _, flags in classified:
+            mask |= flags
+        
+        # Emit each matched feature once, minus the current one
+        return [name for flag, name in _FEATURE_FLAGS if mask & flag and name != current_feature]
     
-    def _calculate_complexity(self, files: List[str]) -> float:
+    def _calculate_complexity(self, classified: List[Tuple[str, int]]) -> float:
         """Calculate complexity score based on files"""
         # Simple heuristic: more files and certain patterns = higher complexity
-        n = len(files)
+        n = len(classified)
         base_score = min(1.0, 0.3 + 0.1 * n)
         
+        mask = 0
+        for _, flags in classified:
+            mask |= flags
+        
         # Boost for certain file types
-        multipliers = []
-        if any("resolver" in f.lower() for f in files):
-            multipliers.append(1.2)
-        if any(".graphql" in f for f in files):
-            multipliers.append(1.3)
-        if any("config" in f.lower() for f in files):
-            multipliers.append(1.1)
-        if any("test" in f.lower() for f in files):
-            multipliers.append(0.9)  # Tests reduce perceived complexity
-        
-        final_score = base_score
-        for mult in multipliers:
-            final_score *= mult
-        
-        return min(1.0, final_score)
+        return min(1.0, base_score * _COMPLEXITY_LUT[mask & _COMPLEXITY_MASK])
     
     def get_feature_history(self, feature_id: str) -> Dict:
         """Get history of tickets for a feature (for debugging)"""
@@ -672,12 +865,43 @@ Generated by Jr Dev Agent v2 Synthetic Memory
             if os.path.isdir(ticket_path):
                 summary_file = os.path.join(ticket_path, "summary.json")
                 if os.path.exists(summary_file):
-                    with open(summary_file, "r") as f:
-                        summary = json.load(f)
+                    with open(summary_file, "rb") as f:
+                        summary = orjson.loads(f.read())
                         tickets.append(summary)
         
         return {"feature_id": feature_id, "tickets": tickets}
     
+    def _ticket_index_path(self, ticket_id: str) -> str:
+        return os.path.join(self.root, "_index", f"{ticket_id}.json")
+
+    def _index_ticket(self, ticket_id: str, feature_id: str):
+        """Add ``feature_id`` to the features that hold a memory pack for ``ticket_id``."""
+        path = self._ticket_index_path(ticket_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with _TICKET_INDEX_LOCK:
+            try:
+                with open(path, "rb") as f:
+                    feature_ids = orjson.loads(f.read())
+            except (OSError, orjson.JSONDecodeError):
+                feature_ids = []
+            if feature_id not in feature_ids:
+                _write_atomic(path, orjson.dumps(feature_ids + [feature_id]))
+
+    def _indexed_ticket_dirs(self, ticket_id: str, features_root: Path) -> Optional[List[Path]]:
+        """
+        Ticket directories recorded by ``_index_ticket``, or None if the ticket was
+        never indexed or an indexed directory is gone (the caller then searches).
+        """
+        try:
+            with open(self._ticket_index_path(ticket_id), "rb") as f:
+                feature_ids = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        ticket_dirs = [features_root / feature_id / ticket_id for feature_id in feature_ids]
+        if not all(d.is_dir() for d in ticket_dirs):
+            return None
+        return ticket_dirs
+
     async def record_completion(self, ticket_id: str, pr_url: str, pess_score: float, metadata: Dict = None, 
                               changes_made: str = None, change_required: str = None, full_prompt: str = None):
         """
@@ -692,6 +916,18 @@ Generated by Jr Dev Agent v2 Synthetic Memory
             change_required: Summary of task requirements (from LLM)
             full_prompt: The full prompt used for the task
         """
+        # Pack reads and writes are blocking; keep them off the event loop so
+        # callers can overlap them with network calls
+        await asyncio.to_thread(
+            self._record_completion, ticket_id, pr_url, pess_score, metadata,
+            changes_made, change_required, full_prompt,
+        )
+
+    def _record_completion(self, ticket_id: str, pr_url: str, pess_score: float, metadata: Optional[Dict],
+                           changes_made: Optional[str], change_required: Optional[str],
+                           full_prompt: Optional[str]):
+        """Blocking body of ``record_completion``."""
+        now = time.time()
         try:
             # Find all memory locations for this ticket
             if os.path.exists(self.root):
@@ -701,18 +937,24 @@ Generated by Jr Dev Agent v2 Synthetic Memory
                 features_root = root_path / "features"
                 
                 if features_root.exists():
-                    # Recursive search for the ticket directory
-                    for ticket_dir in features_root.glob(f"**/{ticket_id}"):
+                    # Features recorded for the ticket at enrichment time; packs written
+                    # before the index existed fall back to a recursive search
+                    ticket_dirs = self._indexed_ticket_dirs(ticket_id, features_root)
+                    if ticket_dirs is None:
+                        ticket_dirs = features_root.glob(f"**/{ticket_id}")
+                    for ticket_dir in ticket_dirs:
                         if ticket_dir.is_dir():
-                            # Update agent_run.json
-                            agent_run_file = ticket_dir / "agent_run.json"
+                            # Update agent_run.json; plain string paths, matching the scandir
+                            # entry paths the pack cache is keyed by
+                            ticket_path = f"{os.fspath(ticket_dir)}{os.sep}"
+                            agent_run_file = f"{ticket_path}agent_run.json"
                             existing_run_data = {}
-                            if agent_run_file.exists():
-                                try:
-                                    with open(agent_run_file, 'r') as f:
-                                        existing_run_data = json.load(f)
-                                except Exception:
-                                    pass
+                            try:
+                                with open(agent_run_file, 'rb') as f:
+                                    existing_run_data = orjson.loads(f.read())
+                            except (FileNotFoundError, orjson.JSONDecodeError):
+                                # Never written, or truncated by a writer that predates atomic writes
+                                pass
 
                             # Determine feature_id from path if possible
                             # features/<feature_name>/<ticket_id>
@@ -723,33 +965,60 @@ Generated by Jr Dev Agent v2 Synthetic Memory
                             except Exception:
                                 feature_id_from_path = "unknown"
 
+                            # Fields this call doesn't set (e.g. result, template_name) carry over
                             agent_run_data = {
+                                **existing_run_data,
                                 "ticket_id": ticket_id,
                                 "feature_id": feature_id_from_path,
-                                "created_at": existing_run_data.get("created_at", time.time()),
                                 "pr_url": pr_url or existing_run_data.get("pr_url"),
                                 "pess_score": pess_score,
-                                "completion_timestamp": time.time(),
+                                "completion_timestamp": now,
                                 "full_prompt": full_prompt or existing_run_data.get("full_prompt"),
                                 "change_required": change_required or existing_run_data.get("change_required"),
                                 "changes_made": changes_made or existing_run_data.get("changes_made"),
                                 "metadata": metadata or {},
                                 "status": "completed"
                             }
+                            agent_run_data.setdefault("created_at", now)
                             
-                            with open(agent_run_file, "w") as f:
-                                json.dump(agent_run_data, f, indent=2)
+                            _write_atomic(agent_run_file, orjson.dumps(agent_run_data, option=_JSON_OPTS))
+                            with self._pack_cache_lock:
+                                self._pack_cache.pop(agent_run_file, None)
 
                             # Clean up old summary.json if it exists
-                            summary_file = ticket_dir / "summary.json"
-                            if summary_file.exists():
-                                try:
-                                    summary_file.unlink()
-                                    self.logger.info(f"Removed deprecated summary.json for {ticket_id}")
-                                except Exception as e:
-                                    self.logger.warning(f"Could not remove summary.json: {e}")
+                            try:
+                                os.unlink(f"{ticket_path}summary.json")
+                                self.logger.info(f"Removed deprecated summary.json for {ticket_id}")
+                            except FileNotFoundError:
+                                pass
+                            except Exception as e:
+                                self.logger.warning(f"Could not remove summary.json: {e}")
                             
                             self.logger.info(f"Updated memory completion for {ticket_id} in feature {feature_id_from_path}")
                             
         except Exception as e:
-            self.logger.error(f"Error recording completion for {ticket_id}: {str(e)}")
\ No newline at end of file
+            self.logger.error(f"Error recording completion for {ticket_id}: {str(e)}")
+
+
+_memory_services: "OrderedDict[str, SyntheticMemory]" = OrderedDict()
+
+
+async def get_memory_service(root: str) -> SyntheticMemory:
+    """
+    Return an initialized filesystem-backed SyntheticMemory for ``root``.
+
+    Instances are reused per root (LRU, ``MEMORY_SERVICE_CACHE_MAXSIZE``), so
+    back-to-back requests for the same project skip ``initialize`` and keep
+    the parsed-pack cache warm.
+    """
+    memory_service = _memory_services.get(root)
+    if memory_service is not None:
+        _memory_services.move_to_end(root)
+        return memory_service
+
+    memory_service = SyntheticMemory(root=root, backend="fs")
+    await memory_service.initialize()
+    _memory_services[root] = memory_service
+    if len(_memory_services) > MEMORY_SERVICE_CACHE_MAXSIZE:
+        _memory_services.popitem(last=False)
+    return memory_service
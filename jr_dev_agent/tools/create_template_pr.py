@@ -1,9 +1,14 @@
+import asyncio
+import importlib.util
 import logging
 import os
-import json
 import base64
+import random
 import time
+import weakref
+from functools import lru_cache
 import httpx
+import orjson
 from typing import Dict, Any, Optional
 
 from jr_dev_agent.models.mcp import CreateTemplatePRArgs, CreateTemplatePRResult
@@ -23,6 +28,119 @@ TEMPLATE_FILE_MAP = {
     "refactor": "featurePromptTemplates/feature_resolver_change.yaml" # Fallback to feature for now or needs specific path
 }
 
+# Top-level template directories; an explicit path is only accepted inside one of these
+_TEMPLATE_DIRS = frozenset(p.split("/", 1)[0] for p in TEMPLATE_FILE_MAP.values())
+
+# Service config, resolved relative to the working directory
+_CONFIG_PATH = "config.json"
+
+GITHUB_API_URL = "https://api.github.com"
+
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``); fall back to HTTP/1.1 without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30)
+
+# GitHub answers rate limiting with 403/429 (plus Retry-After or X-RateLimit-Reset)
+# and transient outages with 502/503; those are retried with exponential backoff
+_GATEWAY_STATUSES = frozenset({502, 503})
+_RETRY_STATUSES = frozenset({403, 429}) | _GATEWAY_STATUSES
+_MAX_RETRIES = 3
+_RETRY_BACKOFF_SECONDS = 1.0
+_MAX_RETRY_DELAY_SECONDS = 60.0
+
+# Shared across calls so repeated template PRs reuse pooled GitHub connections;
+# auth is sent per request, so the client itself carries no credentials. Pooled
+# connections belong to the loop that opened them, so each event loop gets its
+# own client; entries go away with their loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Lazily create the GitHub API client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            http2=HTTP2_AVAILABLE,
+            limits=_POOL_LIMITS,
+            timeout=30.0,
+        )
+        _clients[loop] = client
+    return client
+
+
+async def aclose_client() -> None:
+    """Close the running loop's GitHub API client (called on server shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _template_path(name: str) -> Optional[str]:
+    """Return ``name`` if it is a file path inside a known template directory."""
+    top, sep, rest = name.partition("/")
+    if sep and rest and top in _TEMPLATE_DIRS and ".." not in rest.split("/"):
+        return name
+    return None
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying ``resp``, or None if it should not be retried."""
+    if resp.status_code not in _RETRY_STATUSES:
+        return None
+
+    headers = resp.headers
+    retry_after = headers.get("retry-after")
+    reset = headers.get("x-ratelimit-reset")
+    if retry_after is not None:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            delay = _RETRY_BACKOFF_SECONDS * 2 ** attempt
+    elif reset is not None and headers.get("x-ratelimit-remaining") == "0":
+        try:
+            delay = float(reset) - time.time()
+        except ValueError:
+            delay = _RETRY_BACKOFF_SECONDS * 2 ** attempt
+    elif resp.status_code == 403:
+        # A 403 without rate-limit headers is a permissions error
+        return None
+    else:
+        delay = _RETRY_BACKOFF_SECONDS * 2 ** attempt + random.random() * 0.1
+    return min(max(delay, 0.0), _MAX_RETRY_DELAY_SECONDS)
+
+
+async def _gh_request(send, url: str, idempotent: bool = True, **kwargs) -> httpx.Response:
+    """Call ``send`` (a client verb such as ``client.post``), retrying rate-limited and transient failures.
+
+    Pass ``idempotent=False`` for POSTs: a 502/503 may come back after GitHub already
+    applied the request, so only rate-limit rejections are retried for them.
+    """
+    for attempt in range(_MAX_RETRIES + 1):
+        resp = await send(url, **kwargs)
+        delay = _retry_delay(resp, attempt) if attempt < _MAX_RETRIES else None
+        if not idempotent and resp.status_code in _GATEWAY_STATUSES:
+            delay = None
+        if delay is None:
+            return resp
+        logger.warning(f"GitHub returned {resp.status_code} for {url}; retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+    return resp
+
+
+async def _delete_branch(client: httpx.AsyncClient, owner: str, repo: str, branch_name: str,
+                         headers: Dict[str, str]) -> None:
+    """Best-effort removal of a branch left behind by a failed template PR."""
+    try:
+        resp = await _gh_request(client.delete, f"/repos/{owner}/{repo}/git/refs/heads/{branch_name}", headers=headers)
+        if resp.status_code != 204:
+            logger.warning(f"Could not delete branch {branch_name}: {resp.text}")
+    except Exception as e:
+        logger.warning(f"Could not delete branch {branch_name}: {e}")
+
+
 async def handle_create_template_pr(args: CreateTemplatePRArgs) -> Dict[str, Any]:
     """
     Handle create_template_pr tool - create a PR to update a prompt template
@@ -58,13 +176,9 @@ async def handle_create_template_pr(args: CreateTemplatePRArgs) -> Dict[str, Any
         token = auth_token
 
     # 2. Resolve File Path
-    file_path = TEMPLATE_FILE_MAP.get(args.template_name)
+    file_path = TEMPLATE_FILE_MAP.get(args.template_name) or _template_path(args.template_name)
     if not file_path:
-        # Try to guess or fail? Let's fail for safety or check if it looks like a path
-        if "/" in args.template_name:
-             file_path = args.template_name
-        else:
-            return _error_response(f"Unknown template name: {args.template_name}. Supported: {list(TEMPLATE_FILE_MAP.keys())}")
+        return _error_response(f"Unknown template name: {args.template_name}. Supported: {list(TEMPLATE_FILE_MAP.keys())}")
 
     # 3. GitHub API Interaction
     headers = {
@@ -73,83 +187,104 @@ async def handle_create_template_pr(args: CreateTemplatePRArgs) -> Dict[str, Any
         "X-GitHub-Api-Version": "2022-11-28"
     }
     
-    async with httpx.AsyncClient(base_url="https://api.github.com", headers=headers, timeout=30.0) as client:
-        try:
-            # A. Get Main Branch SHA
-            resp = await client.get(f"/repos/{owner}/{repo}/git/ref/heads/main")
-            if resp.status_code != 200:
-                return _error_response(f"Failed to fetch main branch: {resp.text}")
-            
-            main_sha = resp.json()["object"]["sha"]
-            
-            # B. Create New Branch
-            branch_name = f"update-template-{args.template_name}-{int(time.time())}"
-            resp = await client.post(f"/repos/{owner}/{repo}/git/refs", json={
+    client = _get_client()
+    branch_created = False
+    try:
+        # A. Get Main Branch SHA
+        resp = await _gh_request(client.get, f"/repos/{owner}/{repo}/git/ref/heads/main", headers=headers)
+        if resp.status_code != 200:
+            return _error_response(f"Failed to fetch main branch: {resp.text}")
+        
+        main_sha = resp.json()["object"]["sha"]
+        
+        # B. Create New Branch and C. Get File SHA (if it exists)
+        # Both only need main's SHA (the new branch starts there), so run them concurrently
+        branch_name = f"update-template-{args.template_name}-{int(time.time())}"
+        # return_exceptions so a failed GET can't hide a branch the POST already created
+        resp, file_resp = await asyncio.gather(
+            _gh_request(client.post, f"/repos/{owner}/{repo}/git/refs", idempotent=False, json={
                 "ref": f"refs/heads/{branch_name}",
                 "sha": main_sha
-            })
-            if resp.status_code != 201:
-                return _error_response(f"Failed to create branch {branch_name}: {resp.text}")
-            
-            # C. Get File SHA (if it exists)
-            resp = await client.get(f"/repos/{owner}/{repo}/contents/{file_path}?ref={branch_name}")
-            file_sha = None
-            if resp.status_code == 200:
-                file_sha = resp.json()["sha"]
-            
-            # D. Update (or Create) File
-            content_encoded = base64.b64encode(args.updated_content.encode("utf-8")).decode("utf-8")
-            payload = {
-                "message": f"Update {args.template_name} template",
-                "content": content_encoded,
-                "branch": branch_name
-            }
-            if file_sha:
-                payload["sha"] = file_sha
-            
-            resp = await client.put(f"/repos/{owner}/{repo}/contents/{file_path}", json=payload)
-            if resp.status_code not in [200, 201]:
-                return _error_response(f"Failed to update file {file_path}: {resp.text}")
-            
-            # E. Create Pull Request
-            pr_payload = {
-                "title": args.pr_title,
-                "body": args.pr_description,
-                "head": branch_name,
-                "base": "main"
-            }
-            resp = await client.post(f"/repos/{owner}/{repo}/pulls", json=pr_payload)
-            if resp.status_code != 201:
-                return _error_response(f"Failed to create PR: {resp.text}")
-            
-            pr_data = resp.json()
-            pr_url = pr_data["html_url"]
-            
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": f"Successfully created PR to update template: {pr_url}"
-                    }
-                ],
-                "_meta": {"pr_url": pr_url, "status": "success"}
-            }
+            }, headers=headers),
+            _gh_request(client.get, f"/repos/{owner}/{repo}/contents/{file_path}?ref={main_sha}", headers=headers),
+            return_exceptions=True,
+        )
+        if isinstance(resp, BaseException):
+            raise resp
+        if resp.status_code != 201:
+            return _error_response(f"Failed to create branch {branch_name}: {resp.text}")
+        branch_created = True
+        if isinstance(file_resp, BaseException):
+            raise file_resp
+        
+        file_sha = None
+        if file_resp.status_code == 200:
+            file_sha = file_resp.json()["sha"]
+        
+        # D. Update (or Create) File
+        # base64 output is pure ASCII
+        content_encoded = base64.b64encode(args.updated_content.encode("utf-8")).decode("ascii")
+        payload = {
+            "message": f"Update {args.template_name} template",
+            "content": content_encoded,
+            "branch": branch_name
+        }
+        if file_sha:
+            payload["sha"] = file_sha
+        
+        resp = await _gh_request(client.put, f"/repos/{owner}/{repo}/contents/{file_path}", json=payload, headers=headers)
+        if resp.status_code not in [200, 201]:
+            await _delete_branch(client, owner, repo, branch_name, headers)
+            return _error_response(f"Failed to update file {file_path}: {resp.text}")
+        
+        # E. Create Pull Request
+        pr_payload = {
+            "title": args.pr_title,
+            "body": args.pr_description,
+            "head": branch_name,
+            "base": "main"
+        }
+        resp = await _gh_request(client.post, f"/repos/{owner}/{repo}/pulls", idempotent=False, json=pr_payload, headers=headers)
+        if resp.status_code != 201:
+            await _delete_branch(client, owner, repo, branch_name, headers)
+            return _error_response(f"Failed to create PR: {resp.text}")
+        
+        pr_data = resp.json()
+        pr_url = pr_data["html_url"]
+        
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"Successfully created PR to update template: {pr_url}"
+                }
+            ],
+            "_meta": {"pr_url": pr_url, "status": "success"}
+        }
 
-        except Exception as e:
-            logger.exception("GitHub API error")
-            return _error_response(f"GitHub API Error: {str(e)}")
+    except Exception as e:
+        logger.exception("GitHub API error")
+        if branch_created:
+            await _delete_branch(client, owner, repo, branch_name, headers)
+        return _error_response(f"GitHub API Error: {str(e)}")
 
 def _load_config() -> Optional[Dict]:
     try:
-        if os.path.exists("config.json"):
-            with open("config.json", "r") as f:
-                data = json.load(f)
-                return data.get("prompt_templates", {})
+        st = os.stat(_CONFIG_PATH)
+    except FileNotFoundError:
         return None
+    try:
+        return _read_prompt_templates_config(_CONFIG_PATH, st.st_mtime_ns)
     except Exception as e:
         logger.error(f"Error loading config: {e}")
         return None
 
+@lru_cache(maxsize=8)
+def _read_prompt_templates_config(path: str, mtime_ns: int) -> Dict:
+    """Parse the ``prompt_templates`` section; cached until the file's mtime changes."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read()).get("prompt_templates", {})
+
 def _error_response(message: str) -> Dict[str, Any]:
     return {
         "content": [
@@ -1,12 +1,36 @@
+import asyncio
+import bisect
 import logging
 import os
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from jr_dev_agent.models.mcp import FinalizeSessionArgs, FinalizeSessionResult
+from jr_dev_agent.utils.load_ticket_metadata import invalidate_ticket_cache
+
+try:
+    from jr_dev_agent.clients import ConfluenceMCPClient
+except ImportError:  # Client might not exist in pure MCP setup
+    ConfluenceMCPClient = None
 
 logger = logging.getLogger(__name__)
 
+# MVP PESS clarity bands: below 50, 50-70, 70-85, 85 and above
+_CLARITY_THRESHOLDS = (50, 70, 85)
+_CLARITY_RATINGS = ("Very Low", "Low", "Medium", "High")
+
+# Appended to the finalize response when the score calls for a template update
+_TEMPLATE_WARNING_FMT = (
+    "\n⚠️ **TEMPLATE UPDATE REQUIRED** ⚠️\n"
+    "The PESS score is below the quality threshold ({score}% < 80%).\n"
+    "You must now IMPROVE the prompt template to prevent this in the future.\n\n"
+    "**Instructions:**\n"
+    "1. Analyze the `full_prompt` in `agent_run.json` and the user feedback.\n"
+    "2. Identify why the previous prompt failed or needed retries.\n"
+    "3. Generate an improved version of the `{template_name}` template.\n"
+    "4. Use the `create_template_pr` tool to submit your improvements.\n"
+).format
+
 async def handle_finalize_session(
     args: FinalizeSessionArgs,
     session_manager,
@@ -20,16 +44,20 @@ async def handle_finalize_session(
     memory updates. For MVP, we implement basic scoring that can be enhanced.
     """
     logger.info(f"Finalizing session: {args.session_id}")
+    completed_at = datetime.now().isoformat()
     
     # Update session with completion information
     try:
         session_manager.complete_session(
             session_id=args.session_id,
             pr_url=args.pr_url,
-            completed_at=datetime.now().isoformat()
+            completed_at=completed_at
         )
     except Exception as e:
         logger.warning(f"Could not update session {args.session_id}: {str(e)}")
+
+    # The ticket is likely updated once work lands; don't serve a stale copy
+    invalidate_ticket_cache(args.ticket_id)
     
     pess_result: Dict[str, Any] = {}
     pess_score_percent: float
@@ -69,7 +97,7 @@ async def handle_finalize_session(
     analytics = {
         "session_id": args.session_id,
         "ticket_id": args.ticket_id,
-        "completion_timestamp": datetime.now().isoformat(),
+        "completion_timestamp": completed_at,
         "files_modified_count": len(args.files_modified),
         "retry_count": args.retry_count,
         "manual_edits": args.manual_edits,
@@ -84,44 +112,22 @@ async def handle_finalize_session(
 
     # Retrieve session to get project_root if available
     session = session_manager.get_session(args.session_id)
-    project_root = session.metadata.get("project_root") if session and session.metadata else None
+    session_meta = (session.metadata if session else None) or {}
+    project_root = session_meta.get("project_root")
 
     # Update synthetic memory with final completion data
+    memory_service = None
     if jr_dev_graph:
         # Determine memory service to use
         memory_service = jr_dev_graph.synthetic_memory
         
-        # If project_root is specified for this session, use a temporary instance pointing to it
+        # If project_root is specified for this session, use the instance pointing to it
         if project_root:
-            from jr_dev_agent.services.synthetic_memory import SyntheticMemory
+            from jr_dev_agent.services.synthetic_memory import get_memory_service
             memory_root = os.path.join(project_root, "syntheticMemory")
-            memory_service = SyntheticMemory(root=memory_root, backend="fs")
-            await memory_service.initialize()
+            memory_service = await get_memory_service(memory_root)
             logger.info(f"Using session-specific memory root: {memory_root}")
 
-        try:
-            await memory_service.record_completion(
-                ticket_id=args.ticket_id,
-                pr_url=args.pr_url or "",
-                pess_score=pess_result.get("prompt_score", 0.5),
-                metadata={
-                    "session_id": args.session_id,
-                    "files_modified": args.files_modified,
-                    "retry_count": args.retry_count,
-                    "manual_edits": args.manual_edits,
-                    "duration_ms": args.duration_ms,
-                    "feedback": args.feedback,
-                    "agent_telemetry": args.agent_telemetry,
-                },
-                change_required=args.change_required,
-                changes_made=args.changes_made
-            )
-        except Exception as e:
-            logger.warning(f"Failed to persist synthetic memory completion: {str(e)}")
-
-    # Trigger Confluence update (mocked locally when not configured)
-    confluence_update = None
-    
     # NEW: Determine if template update is needed based on PESS score
     template_update_request = None
     
@@ -129,11 +135,9 @@ async def handle_finalize_session(
     TEMPLATE_UPDATE_THRESHOLD = 80.0
     
     if pess_score_percent < TEMPLATE_UPDATE_THRESHOLD:
-        # Get template name from metadata or guess based on what we have
-        template_name = "feature" # Default fallback
-        if session and session.metadata and "template_used" in session.metadata:
-            template_name = session.metadata["template_used"]
-            
+        # Get template name from metadata, falling back to feature
+        template_name = session_meta.get("template_used", "feature")
+
         template_update_request = {
             "required": True,
             "template_name": template_name,
@@ -145,30 +149,17 @@ async def handle_finalize_session(
         logger.info(f"Triggering template update request for {template_name} (Score: {pess_score_percent}%)")
 
     # Legacy Confluence update logic (kept for backward compatibility if client configured)
-    if confluence_client is None:
-        try:
-            from jr_dev_agent.clients import ConfluenceMCPClient
-            confluence_client = ConfluenceMCPClient()
-        except ImportError:
-            pass # Client might not exist in pure MCP setup
+    if confluence_client is None and ConfluenceMCPClient is not None:
+        confluence_client = ConfluenceMCPClient()
 
-    if confluence_client:
-        try:
-            update_body = compose_confluence_update(args.ticket_id, args, pess_result)
-            if update_body:
-                page_id = os.getenv("CONFLUENCE_TEMPLATE_PAGE_ID", args.ticket_id)
-                confluence_update = confluence_client.update_template(
-                    page_id=page_id,
-                    new_body=update_body,
-                    metadata={
-                        "ticket_id": args.ticket_id,
-                        "session_id": args.session_id,
-                        "pess_score_percent": pess_score_percent,
-                    },
-                )
-                analytics["confluence_update"] = confluence_update
-        except Exception as e:
-            logger.warning(f"Confluence update failed: {str(e)}")
+    # Trigger Confluence update (mocked locally when not configured). It is
+    # independent of the memory write, so the two run together
+    confluence_update, _ = await asyncio.gather(
+        _update_confluence(confluence_client, args, pess_result, pess_score_percent),
+        _record_memory_completion(memory_service, args, pess_result),
+    )
+    if confluence_update is not None:
+        analytics["confluence_update"] = confluence_update
 
     result = FinalizeSessionResult(
         pess_score=round(pess_score_percent, 1),
@@ -178,21 +169,14 @@ async def handle_finalize_session(
     )
     
     # Format message to Agent
-    response_text = f"Session finalized for {args.ticket_id}.\nPESS Score: {pess_score_percent}%\n"
-    
+    parts = [f"Session finalized for {args.ticket_id}.", f"PESS Score: {pess_score_percent}%"]
     if args.feedback:
-        response_text += f"Feedback: {args.feedback}\n"
-    
+        parts.append(f"Feedback: {args.feedback}")
+    response_text = "\n".join(parts) + "\n"
     if template_update_request:
-        response_text += (
-            "\n⚠️ **TEMPLATE UPDATE REQUIRED** ⚠️\n"
-            f"The PESS score is below the quality threshold ({pess_score_percent}% < 80%).\n"
-            "You must now IMPROVE the prompt template to prevent this in the future.\n\n"
-            "**Instructions:**\n"
-            "1. Analyze the `full_prompt` in `agent_run.json` and the user feedback.\n"
-            "2. Identify why the previous prompt failed or needed retries.\n"
-            f"3. Generate an improved version of the `{template_update_request['template_name']}` template.\n"
-            "4. Use the `create_template_pr` tool to submit your improvements.\n"
+        response_text += _TEMPLATE_WARNING_FMT(
+            score=pess_score_percent,
+            template_name=template_update_request["template_name"],
         )
     
     # Format as valid MCP CallToolResult
@@ -207,6 +191,60 @@ async def handle_finalize_session(
     }
 
 
+async def _record_memory_completion(memory_service, args: FinalizeSessionArgs, pess_result: Dict[str, Any]) -> None:
+    if memory_service is None:
+        return
+    try:
+        await memory_service.record_completion(
+            ticket_id=args.ticket_id,
+            pr_url=args.pr_url or "",
+            pess_score=pess_result.get("prompt_score", 0.5),
+            metadata={
+                "session_id": args.session_id,
+                "files_modified": args.files_modified,
+                "retry_count": args.retry_count,
+                "manual_edits": args.manual_edits,
+                "duration_ms": args.duration_ms,
+                "feedback": args.feedback,
+                "agent_telemetry": args.agent_telemetry,
+            },
+            change_required=args.change_required,
+            changes_made=args.changes_made
+        )
+    except Exception as e:
+        logger.warning(f"Failed to persist synthetic memory completion: {str(e)}")
+
+
+async def _update_confluence(
+    confluence_client,
+    args: FinalizeSessionArgs,
+    pess_result: Dict[str, Any],
+    pess_score_percent: float,
+) -> Optional[Dict[str, Any]]:
+    """Push the session summary to Confluence; returns the update result, or None if nothing was sent."""
+    if not confluence_client:
+        return None
+    try:
+        update_body = compose_confluence_update(args.ticket_id, args, pess_result)
+        if not update_body:
+            return None
+        page_id = os.getenv("CONFLUENCE_TEMPLATE_PAGE_ID", args.ticket_id)
+        # The client is blocking (requests / local file write), so keep it off the event loop
+        return await asyncio.to_thread(
+            confluence_client.update_template,
+            page_id=page_id,
+            new_body=update_body,
+            metadata={
+                "ticket_id": args.ticket_id,
+                "session_id": args.session_id,
+                "pess_score_percent": pess_score_percent,
+            },
+        )
+    except Exception as e:
+        logger.warning(f"Confluence update failed: {str(e)}")
+        return None
+
+
 def compose_confluence_update(
     ticket_id: str,
     args: FinalizeSessionArgs,
@@ -251,43 +289,16 @@ def calculate_mvp_pess_score(args: FinalizeSessionArgs) -> Dict[str, Any]:
     """
     Calculate basic PESS score for MVP and return a structured result.
     """
-    base_score = 85.0  # Start with good score
-    
-    # Retry penalty (5 points per retry)
-    if args.retry_count > 0:
-        base_score -= min(args.retry_count * 5, 20)  # Cap at -20 points
-    
-    # Manual edit penalty (2 points per edit)
-    if args.manual_edits > 0:
-        base_score -= min(args.manual_edits * 2, 15)  # Cap at -15 points
-    
-    # Duration bonus/penalty
-    if args.duration_ms > 0:
-        minutes = args.duration_ms / (1000 * 60)
-        if minutes < 5:  # Very fast completion
-            base_score += 5
-        elif minutes > 30:  # Slow completion
-            base_score -= 10
-    
-    # File modification bonus (shows agent was productive)
-    if len(args.files_modified) > 0:
-        base_score += min(len(args.files_modified) * 2, 10)  # Up to +10 points
-    
-    # PR creation bonus
-    if args.pr_url:
-        base_score += 5
-    
-    # Ensure score is within valid range
-    final_score = max(0.0, min(100.0, base_score))
-    clarity = (
-        "High"
-        if final_score >= 85
-        else "Medium"
-        if final_score >= 70
-        else "Low"
-        if final_score >= 50
-        else "Very Low"
-    )
+    minutes = args.duration_ms / (1000 * 60)
+    final_score = max(0.0, min(100.0,
+        85.0  # Start with good score
+        - min(args.retry_count * 5, 20)  # Retry penalty, capped at -20 points
+        - min(args.manual_edits * 2, 15)  # Manual edit penalty, capped at -15 points
+        + (5 if 0 < minutes < 5 else -10 if minutes > 30 else 0)  # Fast/slow completion
+        + min(len(args.files_modified) * 2, 10)  # Productivity bonus, up to +10 points
+        + (5 if args.pr_url else 0)  # PR creation bonus
+    ))
+    clarity = _CLARITY_RATINGS[bisect.bisect_right(_CLARITY_THRESHOLDS, final_score)]
 
     recommendation = "Continue iterating on this template."
     if final_score >= 90:
@@ -1,11 +1,46 @@
 import logging
+import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 from jr_dev_agent.models.mcp import HealthToolResult, HealthServiceInfo
 
 logger = logging.getLogger(__name__)
 
+# Services whose health entry never changes; built once and reused by every probe
+_STATIC_SERVICES = {
+    "fallback_system": HealthServiceInfo(
+        status="available",
+        version="fallback",
+        details={},
+    ),
+    "mcp_gateway": HealthServiceInfo(
+        status="available",
+        version="mcp_gateway",
+        details={},
+    ),
+}
+
+# Any service in one of these states degrades the overall status
+_UNHEALTHY_STATUSES = frozenset({"degraded", "unavailable"})
+
+# Rapid-fire probes within this window reuse the last graph health snapshot
+GRAPH_HEALTH_TTL_SECONDS = 1.0
+_graph_health_snapshot: Optional[Tuple[Any, float, Dict[str, Any]]] = None
+
+
+def _get_graph_health(jr_dev_graph) -> Dict[str, Any]:
+    """Return ``jr_dev_graph.get_health_status()``, reusing a snapshot younger than the TTL."""
+    global _graph_health_snapshot
+    now = time.monotonic()
+    snapshot = _graph_health_snapshot
+    if snapshot is not None and snapshot[0] is jr_dev_graph and now - snapshot[1] < GRAPH_HEALTH_TTL_SECONDS:
+        return snapshot[2]
+    graph_health = jr_dev_graph.get_health_status()
+    _graph_health_snapshot = (jr_dev_graph, now, graph_health)
+    return graph_health
+
+
 async def handle_health_tool(jr_dev_graph, session_manager) -> Dict[str, Any]:
     """
     Handle health tool - check system status
@@ -15,12 +50,9 @@ async def handle_health_tool(jr_dev_graph, session_manager) -> Dict[str, Any]:
     logger.info("Health check requested via MCP")
     
     # Get health status from existing components
-    graph_health = jr_dev_graph.get_health_status()
+    graph_health = _get_graph_health(jr_dev_graph)
     session_stats = session_manager.get_stats()
     
-    # Determine overall status
-    overall_status = "healthy"
-    
     # Count available tools from registry (imported dynamically to avoid circular import)
     # For now we assume the standard 3 tools
     mcp_tools_available = 3
@@ -46,21 +78,11 @@ async def handle_health_tool(jr_dev_graph, session_manager) -> Dict[str, Any]:
             version="session_manager",
             details={"stats": session_stats},
         ),
-        "fallback_system": HealthServiceInfo(
-            status="available",
-            version="fallback",
-            details={},
-        ),
-        "mcp_gateway": HealthServiceInfo(
-            status="available",
-            version="mcp_gateway",
-            details={},
-        ),
+        **_STATIC_SERVICES,
     }
     
-    service_statuses = [svc.status for svc in services.values()]
-    if "degraded" in service_statuses or "unavailable" in service_statuses:
-        overall_status = "degraded"
+    # Determine overall status
+    overall_status = "degraded" if any(svc.status in _UNHEALTHY_STATUSES for svc in services.values()) else "healthy"
     
     result = HealthToolResult(
         status=overall_status,
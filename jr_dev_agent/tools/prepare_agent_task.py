@@ -1,12 +1,42 @@
+import asyncio
 import logging
+import os
 import uuid
 import re
-from typing import Dict, Any, List
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 
 from jr_dev_agent.models.mcp import PrepareAgentTaskArgs
+from jr_dev_agent.utils.load_ticket_metadata import aload_ticket_metadata
 
 logger = logging.getLogger(__name__)
 
+# File references in a generated prompt, found in one scan
+_FILE_REF_RE = re.compile(
+    r'^-\s+(?P<bullet>[^\s]+\.[a-zA-Z]+)$'  # Files listed with bullets (- path/to/file.ext)
+    r'|`(?P<code>[^`]+\.[a-zA-Z]+)`'  # Files mentioned in markdown code spans
+    r'|(?P<path>[a-zA-Z0-9/_.-]+\.[a-zA-Z]+)',  # Any dotted name; only paths are kept
+    re.MULTILINE,
+)
+_PATH_FILE_RE = re.compile(r'[a-zA-Z0-9/_.-]+\.[a-zA-Z]+')
+MAX_FILES_TO_MODIFY = 10
+
+# CLI commands in a generated prompt. The whole pattern is a lookahead, so one
+# scan reports every (possibly overlapping) occurrence: "npm run build" yields
+# both "npm run build" and "npm run", and "pnpm i" also yields "npm i"
+_COMMAND_RE = re.compile(
+    r'(?=(?P<tool>npm|yarn|pnpm) (?P<arg>\w+)(?: (?P<script>\w+))?'
+    r'|python -m (?P<module>\w+)'
+    r'|(?P<bin>pytest|jest|tsc|eslint|prettier))',
+    re.IGNORECASE,
+)
+
+# fallback_template_path is only honoured for files under this directory; unset
+# disables path-based templates so MCP clients cannot read arbitrary server files
+FALLBACK_TEMPLATE_ROOT = os.getenv("FALLBACK_TEMPLATE_ROOT")
+FALLBACK_TEMPLATE_MAX_BYTES = 256 * 1024
+
 async def handle_prepare_agent_task(
     args: PrepareAgentTaskArgs, 
     jr_dev_graph, 
@@ -18,7 +48,7 @@ async def handle_prepare_agent_task(
     This is the core MCP tool that transforms Jira tickets into executable prompts.
     It reuses the existing v1 LangGraph workflow while formatting output for agents.
     """
-    logger.info(f"Processing prepare_agent_task for ticket: {args.ticket_id}")
+    logger.info("Processing prepare_agent_task for ticket: %s", args.ticket_id)
     
     # Create new session for this MCP request
     session_id = session_manager.create_session(
@@ -32,15 +62,15 @@ async def handle_prepare_agent_task(
         }
     )
     
-    # Load full ticket data first
-    from jr_dev_agent.utils.load_ticket_metadata import load_ticket_metadata
-    
+    # Inline content wins; a template path is read in a worker thread so the
+    # event loop keeps serving other MCP requests
+    fallback_content = args.fallback_template_content
+    if not fallback_content and args.fallback_template_path:
+        fallback_content = await asyncio.to_thread(_read_fallback_template, args.fallback_template_path)
+
     # Load complete ticket metadata (always attempt this first)
-    full_ticket_data = load_ticket_metadata(
-        args.ticket_id,
-        fallback_content=args.fallback_template_content
-    )
-    logger.info(f"Loaded ticket data for {args.ticket_id}: {list(full_ticket_data.keys())}")
+    full_ticket_data = await aload_ticket_metadata(args.ticket_id, fallback_content=fallback_content)
+    logger.info("Loaded ticket data for %s: %s", args.ticket_id, list(full_ticket_data))
 
     # Prefer full LangGraph workflow, but fall back to a local prompt build if it fails.
     workflow_result: Dict[str, Any] = {}
@@ -55,6 +85,8 @@ async def handle_prepare_agent_task(
     except Exception as workflow_error:
         # Known intermittent failure mode: BrokenPipeError / OSError(32) coming from the runtime.
         # We still want a usable, agent-ready prompt for the developer.
+        # Deliberately broad: any graph node can fail, and Jira/ticket errors were
+        # already raised by aload_ticket_metadata above, outside this block.
         logger.error(
             "LangGraph workflow failed; falling back to local prompt build",
             exc_info=workflow_error,
@@ -76,7 +108,7 @@ async def handle_prepare_agent_task(
             # Non-fatal: PromptBuilder.initialize is idempotent, but shouldn't block fallback.
             pass
 
-        prompt = await jr_dev_graph.prompt_builder.generate_prompt(
+        prompt = jr_dev_graph.prompt_builder.generate_prompt(
             template_name=template_used,
             ticket_data=ticket_for_builder,
             enrichment_data={"context_enriched": False},
@@ -100,8 +132,7 @@ async def handle_prepare_agent_task(
     )
     
     # Extract actionable metadata for agent execution
-    files_to_modify = extract_files_from_prompt(workflow_result["prompt"])
-    commands = extract_commands_from_prompt(workflow_result["prompt"])
+    files_to_modify, commands = extract_prompt_targets(workflow_result["prompt"])
     
     result = {
         "content": [
@@ -132,24 +163,53 @@ async def handle_prepare_agent_task(
         }
     }
     
-    logger.info(f"Successfully generated agent-ready prompt for {args.ticket_id}")
+    logger.info("Successfully generated agent-ready prompt for %s", args.ticket_id)
     return result
 
 
-def format_prompt_for_agent(prompt: str, metadata: Dict[str, Any], template_used: str) -> str:
+def _read_fallback_template(path: Optional[str]) -> Optional[str]:
     """
-    Format the generated prompt for agent consumption
+    Read a client-side fallback template by path.
+
+    Lets clients that share the server's filesystem point at the template
+    instead of embedding the whole file in the JSON-RPC arguments. Only
+    regular files inside FALLBACK_TEMPLATE_ROOT are read: relative paths are
+    taken from that root, and ``..`` segments, symlinks and files over
+    FALLBACK_TEMPLATE_MAX_BYTES are rejected.
+
+    Raises:
+        ValueError: If the path is not allowed or the file cannot be read.
     """
-    agent_header = f"""# 🤖 Agent Execution Mode - {template_used.upper()}
+    if not path:
+        return None
+    if not FALLBACK_TEMPLATE_ROOT:
+        raise ValueError("fallback_template_path is disabled; set FALLBACK_TEMPLATE_ROOT or send fallback_template_content")
 
-**IMPORTANT**: This prompt is designed for immediate agent execution. 
-Please execute all steps systematically and create a PR when complete.
+    root = Path(FALLBACK_TEMPLATE_ROOT).resolve()
+    candidate = Path(path)
+    if ".." in candidate.parts:
+        raise ValueError(f"Fallback template path may not contain '..': {path}")
+    candidate = root / candidate  # an absolute path replaces the root
 
----
+    try:
+        # Any symlink along the way makes the resolved path differ
+        resolved = candidate.resolve(strict=True)
+        if resolved != candidate or not resolved.is_relative_to(root):
+            raise ValueError(f"Fallback template must be a file under {root}: {path}")
+        if not resolved.is_file():
+            raise ValueError(f"Fallback template is not a regular file: {path}")
+        # O_NOFOLLOW closes the window for swapping in a symlink after the check
+        fd = os.open(resolved, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+        with os.fdopen(fd, "rb") as fh:
+            data = fh.read(FALLBACK_TEMPLATE_MAX_BYTES + 1)
+        if len(data) > FALLBACK_TEMPLATE_MAX_BYTES:
+            raise ValueError(f"Fallback template exceeds {FALLBACK_TEMPLATE_MAX_BYTES} bytes: {path}")
+        return data.decode("utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        raise ValueError(f"Could not read fallback template at {path}: {e}") from e
 
-"""
-    
-    success_footer = """
+
+_SUCCESS_FOOTER = """
 
 ---
 
@@ -167,68 +227,95 @@ Please execute all steps systematically and create a PR when complete.
 
 You may use the "Mark Complete" button in the IDE to finalize the session.
 """
-    
-    return agent_header + prompt + success_footer
+
+
+@lru_cache(maxsize=16)
+def _agent_header(template_used: str) -> str:
+    return f"""# 🤖 Agent Execution Mode - {template_used.upper()}
+
+**IMPORTANT**: This prompt is designed for immediate agent execution. 
+Please execute all steps systematically and create a PR when complete.
+
+---
+
+"""
+
+
+def format_prompt_for_agent(prompt: str, metadata: Dict[str, Any], template_used: str) -> str:
+    """
+    Format the generated prompt for agent consumption
+
+    ``metadata`` is accepted for callers' convenience but does not affect the output.
+    """
+    return "".join((_agent_header(template_used), prompt, _SUCCESS_FOOTER))
+
+
+def extract_prompt_targets(prompt: str) -> Tuple[List[str], List[str]]:
+    """Extract the files and CLI commands mentioned in the prompt"""
+    return extract_files_from_prompt(prompt), extract_commands_from_prompt(prompt)
 
 
 def extract_files_from_prompt(prompt: str) -> List[str]:
-    """Extract file paths mentioned in the prompt"""
-    files = []
-    
-    # Pattern 1: Files listed with bullets (- path/to/file.ext)
-    bullet_files = re.findall(r'^-\s+([^\s]+\.[a-zA-Z]+)$', prompt, re.MULTILINE)
-    files.extend(bullet_files)
-    
-    # Pattern 2: Files mentioned in markdown code blocks
-    code_files = re.findall(r'`([^`]+\.[a-zA-Z]+)`', prompt)
-    files.extend(code_files)
-    
-    # Pattern 3: Common file extensions in paths
-    path_files = re.findall(r'([a-zA-Z0-9/_.-]+\.[a-zA-Z]+)', prompt)
-    files.extend([f for f in path_files if '/' in f])  # Only paths, not just extensions
-    
-    # Remove duplicates and filter common paths
-    unique_files = list(set(files))
-    filtered_files = [f for f in unique_files if not f.startswith('http') and len(f) > 3]
-    
-    return filtered_files[:10]  # Limit to 10 most relevant files
+    """Extract file paths mentioned in the prompt, in order of first mention"""
+    files: Dict[str, None] = {}
+
+    def add(f: str) -> None:
+        if not f.startswith('http') and len(f) > 3:
+            files[f] = None
+
+    for match in _FILE_REF_RE.finditer(prompt):
+        listed = match.group('bullet') or match.group('code')
+        if listed:
+            add(listed)
+            # Paths inside a bullet or code span count on their own as well
+            for f in _PATH_FILE_RE.findall(listed):
+                if '/' in f:
+                    add(f)
+        elif '/' in match.group('path'):  # Only paths, not just extensions
+            add(match.group('path'))
+        if len(files) >= MAX_FILES_TO_MODIFY:
+            break
+
+    return list(files)[:MAX_FILES_TO_MODIFY]
 
 
 def extract_commands_from_prompt(prompt: str) -> List[str]:
     """Extract CLI commands mentioned in the prompt"""
-    commands = []
-    
-    command_patterns = [
-        r'npm run (\w+)',
-        r'npm (\w+)',
-        r'yarn (\w+)',
-        r'pnpm (\w+)',
-        r'python -m (\w+)',
-        r'pytest',
-        r'jest',
-        r'tsc',
-        r'eslint',
-        r'prettier'
-    ]
-    
-    for pattern in command_patterns:
-        matches = re.findall(pattern, prompt, re.IGNORECASE)
-        if pattern == r'npm run (\w+)':
-            commands.extend([f"npm run {match}" for match in matches])
-        elif pattern == r'npm (\w+)':
-            commands.extend([f"npm {match}" for match in matches])
-        elif pattern == r'yarn (\w+)':
-            commands.extend([f"yarn {match}" for match in matches])
-        elif pattern == r'pnpm (\w+)':
-            commands.extend([f"pnpm {match}" for match in matches])
+    commands = set()
+    # Where the last accepted match of each command form ended; a form never
+    # matches inside its own previous match
+    match_ends: Dict[str, int] = {}
+
+    def accept(form: str, start: int, end: int) -> bool:
+        if start < match_ends.get(form, 0):
+            return False
+        match_ends[form] = end
+        return True
+
+    for match in _COMMAND_RE.finditer(prompt):
+        start = match.start()
+        tool, arg, script = match.group('tool', 'arg', 'script')
+        if tool:
+            tool = tool.lower()
+            if accept(tool, start, match.end('arg')):
+                commands.add(f"{tool} {arg}")
+            if (tool == 'npm' and script and arg.lower() == 'run'
+                    and accept('npm run', start, match.end('script'))):
+                commands.add(f"npm run {script}")
+        elif match.group('module'):
+            if accept('python -m', start, match.end('module')):
+                commands.add(match.group('module'))
         else:
-            commands.extend(matches)
+            # Tool names cannot overlap themselves, so every hit counts
+            commands.add(match.group('bin'))
     
     # Add common commands if not already present
-    if 'test' in prompt.lower() and not any('test' in cmd for cmd in commands):
-        commands.append('npm test')
+    prompt_lower = prompt.lower()
+    if 'test' in prompt_lower and not any('test' in cmd for cmd in commands):
+        commands.add('npm test')
     
-    if 'generate' in prompt.lower() and not any('generate' in cmd for cmd in commands):
-        commands.append('npm run generate')
+    if 'generate' in prompt_lower and not any('generate' in cmd for cmd in commands):
+        commands.add('npm run generate')
     
-    return list(set(commands))  # Remove duplicates
+    # Sorted so the agent sees the same command order on every call
+    return sorted(commands)
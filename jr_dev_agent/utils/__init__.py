@@ -11,6 +11,8 @@ Version: 1.0
 
 from .load_ticket_metadata import (
     load_ticket_metadata,
+    aload_ticket_metadata,
+    invalidate_ticket_cache,
     load_from_fallback,
     validate_ticket_metadata,
     get_fallback_status,
@@ -21,6 +23,8 @@ from .load_ticket_metadata import (
 
 __all__ = [
     "load_ticket_metadata",
+    "aload_ticket_metadata",
+    "invalidate_ticket_cache",
     "load_from_fallback", 
     "validate_ticket_metadata",
     "get_fallback_status",
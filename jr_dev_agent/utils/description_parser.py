@@ -1,6 +1,8 @@
 import re
 try:
     import yaml
+    # libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     yaml = None
 import textwrap
@@ -9,6 +11,28 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Strategy 1: a ```yaml ... ``` block (non-greedy content)
+_YAML_BLOCK_RE = re.compile(r"```yaml\s+(.*?)\s+```", re.DOTALL | re.IGNORECASE)
+
+# Strategy 3: root-level keys of a template that is not valid YAML
+_NAME_RE = re.compile(r"^name:\s*(.+)$", re.MULTILINE | re.IGNORECASE)
+# prompt_text: with optional | or >, captured until the next root-level key (word:) or end of string
+_PROMPT_TEXT_RE = re.compile(r"^prompt_text:\s*[|>]?(.*?)(?=^[\w-]+:|\Z)", re.MULTILINE | re.DOTALL | re.IGNORECASE)
+_FEATURE_RE = re.compile(r"^(?:feature|feature_name):\s*(.+)$", re.MULTILINE | re.IGNORECASE)
+_TYPE_RE = re.compile(r"^type:\s*(.+)$", re.MULTILINE | re.IGNORECASE)
+# Locates every candidate key line in one scan; the per-key patterns above then
+# read the value in place
+_TEMPLATE_KEY_RE = re.compile(
+    r"^(?:(?P<name>name)|(?P<prompt_text>prompt_text)|(?P<feature>feature(?:_name)?)|(?P<type>type)):",
+    re.MULTILINE | re.IGNORECASE,
+)
+_TEMPLATE_VALUE_RES = {
+    "name": _NAME_RE,
+    "prompt_text": _PROMPT_TEXT_RE,
+    "feature": _FEATURE_RE,
+    "type": _TYPE_RE,
+}
+
 def extract_template_from_description(description: str) -> Optional[Dict[str, Any]]:
     """
     Extract a YAML template definition from a Jira ticket description.
@@ -25,11 +49,19 @@ def extract_template_from_description(description: str) -> Optional[Dict[str, An
     """
     if not description or not description.strip():
         return None
+
+    # Every strategy needs a ```yaml block or a name: key; plain prose bails out
+    # here without touching the regex engine or the YAML parser
+    description_lower = description.lower()
+    has_yaml_block = "```yaml" in description_lower
+    if not has_yaml_block and "name:" not in description_lower:
+        return None
         
+    # Strategies 2 and 3 share this heuristic for key-value text
+    has_template_keys = ":" in description and "name:" in description_lower
+
     # Strategy 1: Check for explicit YAML code block
-    # We use a non-greedy match for the content
-    yaml_block_pattern = re.compile(r"```yaml\s+(.*?)\s+```", re.DOTALL | re.IGNORECASE)
-    match = yaml_block_pattern.search(description)
+    match = _YAML_BLOCK_RE.search(description) if has_yaml_block else None
     
     yaml_content = None
     
@@ -38,72 +70,82 @@ def extract_template_from_description(description: str) -> Optional[Dict[str, An
         # Dedent the content to handle indentation issues
         yaml_content = textwrap.dedent(yaml_content)
         logger.debug("Found YAML code block in description")
-    else:
+    elif has_template_keys:
         # Strategy 2: Attempt to parse the entire description as YAML
-        # (Use a heuristic to check if it looks like YAML key-values)
-        # Check case-insensitively
-        description_lower = description.lower()
-        if ":" in description and "name:" in description_lower:
-             yaml_content = description
-             # Attempt dedent just in case
-             yaml_content = textwrap.dedent(yaml_content)
-             logger.debug("Attempting to parse full description as YAML")
-
-    if yaml and yaml_content:
-        try:
-            data = yaml.safe_load(yaml_content)
-            if isinstance(data, dict):
-                # Normalize keys to lowercase to handle "Name:" vs "name:"
-                data = {k.lower(): v for k, v in data.items()}
-                
-                # Map aliases to "feature"
-                if "feature" not in data:
-                    if "type" in data:
-                        data["feature"] = data["type"]
-                    elif "feature_name" in data:
-                        data["feature"] = data["feature_name"]
-                    
-                logger.info("Successfully extracted template from description", 
-                            template_name=data.get('name'))
-                return data
-        except yaml.YAMLError as e:
-            logger.warning("Failed to parse YAML from description", error=str(e))
-    elif not yaml and yaml_content:
-        logger.warning("PyYAML not installed - skipping YAML parsing strategies")
+        yaml_content = textwrap.dedent(description)
+        logger.debug("Attempting to parse full description as YAML")
+
+    if yaml_content:
+        template = _load_yaml_template(yaml_content)
+        if template is not None:
+            return template
             
     # Strategy 3: Regex Fallback for "dirty" YAML or partial template
     # This handles cases where copy-paste artifacts (like "reference files" lines) break strict YAML
-    description_lower = description.lower()
-    if ":" in description and "name:" in description_lower:
-        logger.debug("Attempting regex fallback for template extraction")
-        extracted = {}
-        
-        # Extract name
-        name_match = re.search(r"^name:\s*(.+)$", description, re.MULTILINE | re.IGNORECASE)
-        if name_match:
-            extracted["name"] = name_match.group(1).strip()
-            
-        # Extract prompt_text
-        # Look for prompt_text: followed by optional | or >
-        # Capture until next root-level key (word:) or end of string
-        prompt_match = re.search(r"^prompt_text:\s*[|>]?(.*?)(?=^[\w-]+:|\Z)", description, re.MULTILINE | re.DOTALL | re.IGNORECASE)
-        if prompt_match:
-            extracted["prompt_text"] = prompt_match.group(1).strip()
-            
-        # Extract feature if present (Priority: Feature/feature_Name > Type)
-        # First check for explicit feature keys
-        feature_match = re.search(r"^(?:feature|feature_name):\s*(.+)$", description, re.MULTILINE | re.IGNORECASE)
-        if feature_match:
-            extracted["feature"] = feature_match.group(1).strip()
-        else:
-            # Fallback to Type if no explicit feature key
-            type_match = re.search(r"^type:\s*(.+)$", description, re.MULTILINE | re.IGNORECASE)
-            if type_match:
-                extracted["feature"] = type_match.group(1).strip()
-
-        if extracted.get("name") or extracted.get("prompt_text"):
-             logger.info("Successfully extracted template via regex fallback", 
-                        template_name=extracted.get("name"))
-             return extracted
+    if has_template_keys:
+        return _extract_template_fields(description)
 
     return None
+
+
+def _load_yaml_template(yaml_content: str) -> Optional[Dict[str, Any]]:
+    """Parse YAML content into a template dict, or None if it is not a mapping."""
+    if not yaml:
+        logger.warning("PyYAML not installed - skipping YAML parsing strategies")
+        return None
+
+    try:
+        data = yaml.load(yaml_content, Loader=_YamlLoader)
+    except yaml.YAMLError as e:
+        logger.warning("Failed to parse YAML from description", error=str(e))
+        return None
+
+    if not isinstance(data, dict):
+        return None
+
+    # Normalize keys to lowercase to handle "Name:" vs "name:"
+    data = {k.lower(): v for k, v in data.items()}
+
+    # Map aliases to "feature"
+    if "feature" not in data:
+        if "type" in data:
+            data["feature"] = data["type"]
+        elif "feature_name" in data:
+            data["feature"] = data["feature_name"]
+
+    logger.info("Successfully extracted template from description",
+                template_name=data.get('name'))
+    return data
+
+
+def _extract_template_fields(description: str) -> Optional[Dict[str, Any]]:
+    """Pull root-level template keys out of text that is not valid YAML."""
+    logger.debug("Attempting regex fallback for template extraction")
+    # First occurrence of each key wins, as with a separate search per key
+    fields = {}
+    for key_match in _TEMPLATE_KEY_RE.finditer(description):
+        key = key_match.lastgroup
+        if key in fields:
+            continue
+        value_match = _TEMPLATE_VALUE_RES[key].match(description, key_match.start())
+        if value_match:
+            fields[key] = value_match.group(1).strip()
+            if len(fields) == len(_TEMPLATE_VALUE_RES):
+                break
+
+    extracted = {}
+    if "name" in fields:
+        extracted["name"] = fields["name"]
+    if "prompt_text" in fields:
+        extracted["prompt_text"] = fields["prompt_text"]
+    # Priority: Feature/feature_Name > Type
+    feature = fields.get("feature", fields.get("type"))
+    if feature is not None:
+        extracted["feature"] = feature
+
+    if not (extracted.get("name") or extracted.get("prompt_text")):
+        return None
+
+    logger.info("Successfully extracted template via regex fallback",
+                template_name=extracted.get("name"))
+    return extracted
@@ -102,6 +102,24 @@ class JiraAPIError(Exception):
     """Exception raised when Jira API fails"""
     pass
 
+# Shared Jira MCP client so repeated fetches reuse one connection pool
+_jira_client: Optional[JiraMCPClient] = None
+
+
+def _get_jira_client() -> JiraMCPClient:
+    """Return the process-wide Jira MCP client, creating it on first use."""
+    global _jira_client
+    if _jira_client is None:
+        _jira_client = JiraMCPClient()
+    return _jira_client
+
+
+def invalidate_ticket_cache(ticket_id: Optional[str] = None) -> None:
+    """Evict cached Jira MCP payloads so the next load refetches the ticket."""
+    if _jira_client is not None:
+        _jira_client.invalidate(ticket_id)
+
+
 def load_ticket_metadata(ticket_id: str, fallback_content: Optional[str] = None) -> Dict[str, Any]:
     """
     Load ticket metadata with fallback mechanism.
@@ -117,6 +135,59 @@ def load_ticket_metadata(ticket_id: str, fallback_content: Optional[str] = None)
         JiraFallbackError: If fallback loading fails
         ValueError: If ticket ID is invalid
     """
+    override = _load_local_override(ticket_id, fallback_content)
+    if override is not None:
+        return override
+
+    # Attempt to use the Jira MCP client when configured
+    client = _get_jira_client()
+    if client.configured:
+        try:
+            logger.info("Fetching ticket from Jira MCP", ticket_id=ticket_id, url=client.base_url)
+            return _validate_jira_payload(client.fetch_ticket(ticket_id))
+        except Exception as exc:
+            logger.warning(
+                "Jira MCP fetch failed - falling back to local data",
+                ticket_id=ticket_id,
+                error=str(exc)
+            )
+
+    return _load_after_mcp_failure(ticket_id)
+
+
+async def aload_ticket_metadata(ticket_id: str, fallback_content: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Async variant of :func:`load_ticket_metadata`.
+
+    Identical fallback chain, but the Jira MCP round-trip is awaited so the
+    calling event loop keeps serving other requests during network I/O.
+    """
+    override = _load_local_override(ticket_id, fallback_content)
+    if override is not None:
+        return override
+
+    client = _get_jira_client()
+    if client.configured:
+        try:
+            logger.info("Fetching ticket from Jira MCP", ticket_id=ticket_id, url=client.base_url)
+            return _validate_jira_payload(await client.afetch_ticket(ticket_id))
+        except Exception as exc:
+            logger.warning(
+                "Jira MCP fetch failed - falling back to local data",
+                ticket_id=ticket_id,
+                error=str(exc)
+            )
+
+    return _load_after_mcp_failure(ticket_id)
+
+
+def _load_local_override(ticket_id: str, fallback_content: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Resolve the sources that take precedence over Jira MCP.
+
+    Returns ticket metadata when client-provided content or dev mode applies,
+    otherwise None so the caller proceeds to Jira MCP.
+    """
     if not ticket_id or not ticket_id.strip():
         raise ValueError("Ticket ID cannot be empty")
     
@@ -164,23 +235,18 @@ def load_ticket_metadata(ticket_id: str, fallback_content: Optional[str] = None)
                 logger.warning(f"Text template validation failed: {e}. Falling back to JSON.")
                 
         return load_from_fallback(ticket_id)
-    
-    # Attempt to use the Jira MCP client when configured
-    client = JiraMCPClient()
-    if client.configured:
-        try:
-            logger.info("Fetching ticket from Jira MCP", ticket_id=ticket_id, url=client.base_url)
-            metadata = client.fetch_ticket(ticket_id)
-            if not metadata:
-                raise ValueError("Empty payload from Jira MCP")
-            return validate_ticket_metadata(metadata).to_dict()
-        except Exception as exc:
-            logger.warning(
-                "Jira MCP fetch failed - falling back to local data",
-                ticket_id=ticket_id,
-                error=str(exc)
-            )
-    
+
+    return None
+
+
+def _validate_jira_payload(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    if not metadata:
+        raise ValueError("Empty payload from Jira MCP")
+    return validate_ticket_metadata(metadata).to_dict()
+
+
+def _load_after_mcp_failure(ticket_id: str) -> Dict[str, Any]:
+    """Run the local fallback chain used when Jira MCP is unavailable or failed."""
     # MCP not available or failed - trigger fallback chain
     logger.info(f"[MCP Fallback Triggered] Reason: MCP unavailable for {ticket_id}")
     
@@ -41,6 +41,16 @@ async def aiohttp_session():
         yield session
 
 
+@pytest.fixture
+def memory_root(tmp_path, monkeypatch):
+    """
+    Run the test from tmp_path so the default relative ``syntheticMemory`` root
+    (memory packs, ticket index, mock Confluence payloads) never lands in the checkout.
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "syntheticMemory"
+
+
 @pytest.fixture
 def mock_database():
     """Mock database connection for testing."""
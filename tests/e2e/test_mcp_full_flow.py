@@ -3,10 +3,13 @@ import os
 import shutil
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, patch, AsyncMock
 from fastapi.testclient import TestClient
 from jr_dev_agent.server.main import app, jr_dev_graph, session_manager
 
+# Memory packs and mock Confluence payloads go to tmp_path, not the checkout
+pytestmark = pytest.mark.usefixtures("memory_root")
+
 @pytest.mark.asyncio
 async def test_api_e2e_flow():
     """Test full E2E flow via API endpoints"""
@@ -44,7 +47,7 @@ async def test_api_e2e_flow():
             }
             
             # Mock load_ticket_metadata globally
-            with patch("jr_dev_agent.utils.load_ticket_metadata.load_ticket_metadata") as mock_load:
+            with patch("jr_dev_agent.tools.prepare_agent_task.aload_ticket_metadata", new_callable=AsyncMock) as mock_load:
                 mock_load.return_value = {
                     "ticket_id": ticket_id,
                     "summary": "E2E API Test",
@@ -152,7 +155,7 @@ async def test_api_fallback_scenarios():
                 }
             }
             
-            with patch("jr_dev_agent.utils.load_ticket_metadata.load_ticket_metadata") as mock_load:
+            with patch("jr_dev_agent.tools.prepare_agent_task.aload_ticket_metadata", new_callable=AsyncMock) as mock_load:
                 mock_load.return_value = {
                     "ticket_id": ticket_id,
                     "summary": "Fallback Test",
@@ -249,7 +252,7 @@ async def test_api_custom_project_root():
                 }
             }
             
-            with patch("jr_dev_agent.utils.load_ticket_metadata.load_ticket_metadata") as mock_load:
+            with patch("jr_dev_agent.tools.prepare_agent_task.aload_ticket_metadata", new_callable=AsyncMock) as mock_load:
                 mock_load.return_value = {
                     "ticket_id": ticket_id,
                     "summary": "Custom Root Test",
@@ -10,6 +10,9 @@ from jr_dev_agent.server.main import app, jr_dev_graph
 from jr_dev_agent.server.mcp_gateway import add_mcp_routes
 from jr_dev_agent.server.main import jr_dev_graph, session_manager
 
+# Memory packs and mock Confluence payloads go to tmp_path, not the checkout
+pytestmark = pytest.mark.usefixtures("memory_root")
+
 @pytest.fixture(autouse=True)
 def ensure_routes():
     # Ensure MCP routes are registered for all tests in this file
@@ -41,10 +44,9 @@ async def test_template_update_e2e_flow():
             "auth_token": "mock_token"
         }
         
-        # Mock httpx.AsyncClient for GitHub API calls
-        with patch("httpx.AsyncClient", autospec=True) as MockClient:
-            mock_client_instance = AsyncMock()
-            MockClient.return_value.__aenter__.return_value = mock_client_instance
+        # Mock the shared GitHub API client
+        mock_client_instance = AsyncMock()
+        with patch("jr_dev_agent.tools.create_template_pr._get_client", return_value=mock_client_instance):
             
             # Setup successful GitHub interactions
             async def get_side_effect(url, **kwargs):
@@ -86,7 +88,7 @@ async def test_template_update_e2e_flow():
                         }
                     }
                     
-                    with patch("jr_dev_agent.utils.load_ticket_metadata.load_ticket_metadata") as mock_load:
+                    with patch("jr_dev_agent.tools.prepare_agent_task.aload_ticket_metadata", new_callable=AsyncMock) as mock_load:
                         mock_load.return_value = {
                             "ticket_id": ticket_id,
                             "summary": "Template Update Test",
@@ -73,7 +73,7 @@ async def test_fallback_e2e_flow():
         builder = PromptBuilder()
         await builder.initialize()
         
-        prompt = await builder.generate_prompt("feature", ticket_data)
+        prompt = builder.generate_prompt("feature", ticket_data)
         
         if not prompt or len(prompt) < 10:
             logger.error("❌ Generated prompt is empty or too short")
@@ -1,6 +1,5 @@
 import json
 import os
-from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
@@ -27,8 +26,8 @@ def test_tools_list(client: TestClient):
     assert "finalize_session" in tool_names
 
 
-def test_prepare_and_finalize_flow(client: TestClient, monkeypatch):
-    # Ensure Confluence mock writes to a temporary directory for the test.
+def test_prepare_and_finalize_flow(client: TestClient, monkeypatch, memory_root):
+    # memory_root runs the test from tmp_path, so the Confluence mock writes there.
     monkeypatch.setenv("DEV_MODE", "true")
     monkeypatch.setenv("CONFLUENCE_MCP_URL", "")
 
@@ -81,10 +80,8 @@ def test_prepare_and_finalize_flow(client: TestClient, monkeypatch):
     assert finalize_body["_meta"]["pess_score"] >= 0.0
 
     # Verify that a Confluence payload was produced.
-    confluence_path = Path("syntheticMemory") / "_confluence_updates" / f"{ticket_id}.json"
+    confluence_path = memory_root / "_confluence_updates" / f"{ticket_id}.json"
     assert confluence_path.exists()
     with confluence_path.open("r") as fh:
         payload = json.load(fh)
-    assert payload["metadata"]["ticket_id"] == ticket_id
-    # Clean up after assertions so repo stays pristine.
-    confluence_path.unlink(missing_ok=True)
\ No newline at end of file
+    assert payload["metadata"]["ticket_id"] == ticket_id
\ No newline at end of file
@@ -4,6 +4,9 @@ import json
 from fastapi.testclient import TestClient
 from jr_dev_agent.server.main import app
 
+# Memory packs and mock Confluence payloads go to tmp_path, not the checkout
+pytestmark = pytest.mark.usefixtures("memory_root")
+
 @pytest.fixture(scope="module")
 def client():
     with TestClient(app) as test_client:
@@ -33,7 +33,7 @@ async def test_prompt_generation_robustness():
     }
     
     try:
-        prompt = await builder.generate_prompt("feature", ticket_data_bad_labels)
+        prompt = builder.generate_prompt("feature", ticket_data_bad_labels)
         logger.info("✅ Test Case 1 PASSED: Generated prompt despite bad labels")
         # Verify output contains stringified dict
         if "{'name': 'feature'}" in prompt:
@@ -60,7 +60,7 @@ async def test_prompt_generation_robustness():
     }
     
     try:
-        prompt = await builder.generate_prompt("feature", ticket_data_clean, enrichment_data_bad)
+        prompt = builder.generate_prompt("feature", ticket_data_clean, enrichment_data_bad)
         logger.info("✅ Test Case 2 PASSED: Generated prompt despite bad enrichment data")
         if "{'file': 'a.ts'}" in prompt:
             logger.info("   Verified related files were stringified")
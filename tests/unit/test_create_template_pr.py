@@ -16,9 +16,8 @@ def mock_config():
 
 @pytest.fixture
 def mock_httpx():
-    with patch("httpx.AsyncClient", autospec=True) as mock_client:
-        mock_instance = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
+    mock_instance = AsyncMock()
+    with patch("jr_dev_agent.tools.create_template_pr._get_client", return_value=mock_instance):
         yield mock_instance
 
 def test_create_template_pr_success(mock_config, mock_httpx):
@@ -153,3 +152,165 @@ def test_create_template_pr_missing_config():
                  pytest.fail(f"Unexpected success structure: {data}")
         else:
              pytest.fail(f"Unexpected response structure: {data}")
+
+@pytest.mark.asyncio
+async def test_gh_request_retries_rate_limited_calls():
+    """429/403 with rate-limit headers are retried after the advertised delay"""
+    import httpx
+    from jr_dev_agent.tools.create_template_pr import _gh_request
+
+    send = AsyncMock(side_effect=[
+        httpx.Response(429, headers={"Retry-After": "2"}),
+        httpx.Response(403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"}),
+        httpx.Response(201),
+    ])
+    with patch("jr_dev_agent.tools.create_template_pr.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        resp = await _gh_request(send, "/repos/org/repo/git/refs")
+
+    assert resp.status_code == 201
+    assert send.await_count == 3
+    assert [call.args[0] for call in mock_sleep.await_args_list] == [2.0, 0.0]
+
+@pytest.mark.asyncio
+async def test_gh_request_does_not_retry_permission_errors():
+    """A plain 403 is returned as-is"""
+    import httpx
+    from jr_dev_agent.tools.create_template_pr import _gh_request
+
+    send = AsyncMock(return_value=httpx.Response(403))
+    with patch("jr_dev_agent.tools.create_template_pr.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        resp = await _gh_request(send, "/repos/org/repo/pulls")
+
+    assert resp.status_code == 403
+    assert send.await_count == 1
+    mock_sleep.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_gh_request_does_not_retry_non_idempotent_gateway_errors():
+    """A POST that got a 502 may already have been applied, so it is not repeated"""
+    import httpx
+    from jr_dev_agent.tools.create_template_pr import _gh_request
+
+    send = AsyncMock(side_effect=[httpx.Response(502), httpx.Response(429, headers={"Retry-After": "1"}), httpx.Response(201)])
+    with patch("jr_dev_agent.tools.create_template_pr.asyncio.sleep", new_callable=AsyncMock):
+        resp = await _gh_request(send, "/repos/org/repo/pulls", idempotent=False)
+        assert resp.status_code == 502
+        assert send.await_count == 1
+
+        resp = await _gh_request(send, "/repos/org/repo/pulls", idempotent=False)
+    assert resp.status_code == 201
+    assert send.await_count == 3
+
+def test_create_template_pr_deletes_branch_when_pr_fails(mock_config, mock_httpx):
+    """A branch created for a PR that could not be opened is cleaned up"""
+    from jr_dev_agent.server.mcp_gateway import add_mcp_routes
+    from jr_dev_agent.server.main import jr_dev_graph, session_manager
+    add_mcp_routes(app, jr_dev_graph, session_manager)
+
+    async def get_side_effect(url, **kwargs):
+        if "/git/ref/heads/main" in url:
+            return MagicMock(status_code=200, json=lambda: {"object": {"sha": "main_sha_123"}})
+        return MagicMock(status_code=404)
+
+    async def post_side_effect(url, **kwargs):
+        if "/git/refs" in url:
+            return MagicMock(status_code=201)
+        return MagicMock(status_code=422, text="Validation Failed")
+
+    mock_httpx.get.side_effect = get_side_effect
+    mock_httpx.post.side_effect = post_side_effect
+    mock_httpx.put.return_value = MagicMock(status_code=201)
+    mock_httpx.delete.return_value = MagicMock(status_code=204)
+
+    request_payload = {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {
+            "name": "create_template_pr",
+            "arguments": {
+                "template_name": "feature",
+                "updated_content": "content",
+                "pr_title": "title",
+                "pr_description": "desc"
+            }
+        },
+        "id": "test-4"
+    }
+
+    response = client.post("/mcp/tools/call", json=request_payload)
+    data = response.json()
+
+    assert data["result"]["isError"] is True
+    assert "Failed to create PR" in data["result"]["content"][0]["text"]
+    mock_httpx.delete.assert_awaited_once()
+    assert "/git/refs/heads/update-template-feature-" in mock_httpx.delete.await_args.args[0]
+
+def test_create_template_pr_deletes_branch_when_contents_get_raises(mock_config, mock_httpx):
+    """A branch created while the concurrent contents GET failed is cleaned up"""
+    import httpx
+    from jr_dev_agent.server.mcp_gateway import add_mcp_routes
+    from jr_dev_agent.server.main import jr_dev_graph, session_manager
+    add_mcp_routes(app, jr_dev_graph, session_manager)
+
+    async def get_side_effect(url, **kwargs):
+        if "/git/ref/heads/main" in url:
+            return MagicMock(status_code=200, json=lambda: {"object": {"sha": "main_sha_123"}})
+        raise httpx.ReadTimeout("timed out")
+
+    mock_httpx.get.side_effect = get_side_effect
+    mock_httpx.post.return_value = MagicMock(status_code=201)
+    mock_httpx.delete.return_value = MagicMock(status_code=204)
+
+    request_payload = {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {
+            "name": "create_template_pr",
+            "arguments": {
+                "template_name": "feature",
+                "updated_content": "content",
+                "pr_title": "title",
+                "pr_description": "desc"
+            }
+        },
+        "id": "test-5"
+    }
+
+    response = client.post("/mcp/tools/call", json=request_payload)
+    data = response.json()
+
+    assert data["result"]["isError"] is True
+    assert "timed out" in data["result"]["content"][0]["text"]
+    mock_httpx.put.assert_not_awaited()
+    mock_httpx.delete.assert_awaited_once()
+    assert "/git/refs/heads/update-template-feature-" in mock_httpx.delete.await_args.args[0]
+
+def test_template_path_allowlist():
+    """Explicit paths are only accepted inside known template directories"""
+    from jr_dev_agent.tools.create_template_pr import _template_path
+
+    assert _template_path("bugFixPromptTemplates/bug_fix_v2.yaml") == "bugFixPromptTemplates/bug_fix_v2.yaml"
+    assert _template_path("src/main.py") is None
+    assert _template_path("featurePromptTemplates/../README.md") is None
+    assert _template_path("feature") is None
+
+def test_github_client_is_per_event_loop():
+    """Each event loop gets its own pooled client; aclose_client closes the current loop's"""
+    import asyncio
+    from jr_dev_agent.tools.create_template_pr import _get_client, aclose_client
+
+    async def get_twice():
+        client = _get_client()
+        assert _get_client() is client
+        return client
+
+    first = asyncio.run(get_twice())
+    second = asyncio.run(get_twice())
+    assert first is not second
+
+    async def close():
+        client = _get_client()
+        await aclose_client()
+        return client
+
+    assert asyncio.run(close()).is_closed
@@ -0,0 +1,65 @@
+import pytest
+from jr_dev_agent.tools import prepare_agent_task
+from jr_dev_agent.tools.prepare_agent_task import _read_fallback_template
+
+
+@pytest.fixture
+def template_root(tmp_path, monkeypatch):
+    root = tmp_path / "templates"
+    root.mkdir()
+    monkeypatch.setattr(prepare_agent_task, "FALLBACK_TEMPLATE_ROOT", str(root))
+    return root
+
+
+def test_reads_template_under_root(template_root):
+    (template_root / "jira_ticket_template.txt").write_text("Ticket: ABC-1\n", encoding="utf-8")
+
+    assert _read_fallback_template("jira_ticket_template.txt") == "Ticket: ABC-1\n"
+    assert _read_fallback_template(str(template_root / "jira_ticket_template.txt")) == "Ticket: ABC-1\n"
+
+
+def test_no_path_returns_none(template_root):
+    assert _read_fallback_template(None) is None
+
+
+@pytest.mark.parametrize("path", ["/etc/passwd", "../secret.txt", "nested/../../secret.txt"])
+def test_rejects_paths_outside_root(template_root, path):
+    (template_root.parent / "secret.txt").write_text("secret", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        _read_fallback_template(path)
+
+
+def test_rejects_symlink(template_root):
+    secret = template_root.parent / "secret.txt"
+    secret.write_text("secret", encoding="utf-8")
+    (template_root / "link.txt").symlink_to(secret)
+
+    with pytest.raises(ValueError, match="under"):
+        _read_fallback_template("link.txt")
+
+
+def test_disabled_without_root(monkeypatch, tmp_path):
+    template = tmp_path / "jira_ticket_template.txt"
+    template.write_text("Ticket: ABC-1\n", encoding="utf-8")
+    monkeypatch.setattr(prepare_agent_task, "FALLBACK_TEMPLATE_ROOT", None)
+
+    with pytest.raises(ValueError, match="disabled"):
+        _read_fallback_template(str(template))
+
+
+def test_unreadable_template_raises_value_error(template_root):
+    with pytest.raises(ValueError, match="Could not read"):
+        _read_fallback_template("missing.txt")
+
+    (template_root / "binary.txt").write_bytes(b"\xff\xfe\x00")
+    with pytest.raises(ValueError, match="Could not read"):
+        _read_fallback_template("binary.txt")
+
+
+def test_rejects_oversized_template(template_root, monkeypatch):
+    monkeypatch.setattr(prepare_agent_task, "FALLBACK_TEMPLATE_MAX_BYTES", 8)
+    (template_root / "big.txt").write_text("x" * 9, encoding="utf-8")
+
+    with pytest.raises(ValueError, match="exceeds"):
+        _read_fallback_template("big.txt")
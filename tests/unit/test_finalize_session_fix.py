@@ -4,6 +4,9 @@ from unittest.mock import AsyncMock, MagicMock
 from jr_dev_agent.tools.finalize_session import handle_finalize_session
 from jr_dev_agent.models.mcp import FinalizeSessionArgs
 
+# Memory packs and mock Confluence payloads go to tmp_path, not the checkout
+pytestmark = pytest.mark.usefixtures("memory_root")
+
 @pytest.mark.asyncio
 async def test_finalize_session_uses_feedback_from_args():
     """
@@ -0,0 +1,179 @@
+import asyncio
+import importlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from jr_dev_agent.clients import jira_client
+from jr_dev_agent.clients.jira_client import JiraMCPClient
+
+
+class _TicketHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so the client pools the connection like it would against a real MCP server
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        ticket_id = body["params"]["arguments"]["ticket_id"]
+        payload = json.dumps({"result": {"ticket": {"ticket_id": ticket_id}}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def jira_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TicketHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_afetch_ticket_from_two_event_loops(jira_server):
+    """Pooled connections from a closed loop are never reused by the next one"""
+    client = JiraMCPClient(base_url=jira_server, token="token")
+
+    first = asyncio.run(client.afetch_ticket("ABC-1"))
+    second = asyncio.run(client.afetch_ticket("ABC-2"))
+
+    assert first == {"ticket_id": "ABC-1"}
+    assert second == {"ticket_id": "ABC-2"}
+
+
+@pytest.fixture
+def mock_transport(monkeypatch):
+    """Route both the async and blocking clients through one httpx.MockTransport handler."""
+    calls = []
+    responses = []
+
+    def handler(request):
+        ticket_id = json.loads(request.content)["params"]["arguments"]["ticket_id"]
+        calls.append(ticket_id)
+        response = responses.pop(0) if responses else None
+        if isinstance(response, Exception):
+            raise response
+        if isinstance(response, int):
+            return httpx.Response(response)
+        return httpx.Response(200, json={"result": {"ticket": {"ticket_id": ticket_id, "call": len(calls)}}})
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(jira_client.httpx, "AsyncHTTPTransport", lambda **kwargs: transport)
+    monkeypatch.setattr(jira_client.httpx, "HTTPTransport", lambda **kwargs: transport)
+    return calls, responses
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock for the client's TTL checks; retry sleeps are skipped."""
+    now = [1000.0]
+    monkeypatch.setattr(jira_client, "time", SimpleNamespace(monotonic=lambda: now[0], sleep=lambda seconds: None))
+    return now
+
+
+def test_fetch_ticket_retries_retryable_statuses(mock_transport, clock):
+    calls, responses = mock_transport
+    responses.extend([503, 429])
+    client = JiraMCPClient(base_url="http://jira.test", token="token")
+
+    assert client.fetch_ticket("ABC-1") == {"ticket_id": "ABC-1", "call": 3}
+    assert calls == ["ABC-1"] * 3
+
+
+def test_fetch_ticket_gives_up_after_max_retries(mock_transport, clock):
+    calls, responses = mock_transport
+    responses.extend([503] * 10)
+    client = JiraMCPClient(base_url="http://jira.test", token="token")
+
+    with pytest.raises(RuntimeError, match="Failed to call Jira MCP"):
+        client.fetch_ticket("ABC-1")
+    assert len(calls) == jira_client._MAX_RETRIES + 1
+
+
+def test_cached_ticket_served_within_ttl(mock_transport, clock):
+    calls, _ = mock_transport
+    client = JiraMCPClient(base_url="http://jira.test", token="token", cache_ttl=60)
+
+    first = client.fetch_ticket("ABC-1")
+    first["enriched"] = True  # callers mutate what they get back
+    clock[0] += 59
+
+    assert client.fetch_ticket("ABC-1") == {"ticket_id": "ABC-1", "call": 1}
+    assert calls == ["ABC-1"]
+
+
+def test_ticket_refetched_after_ttl(mock_transport, clock):
+    calls, _ = mock_transport
+    client = JiraMCPClient(base_url="http://jira.test", token="token", cache_ttl=60)
+
+    client.fetch_ticket("ABC-1")
+    clock[0] += 61
+
+    assert client.fetch_ticket("ABC-1") == {"ticket_id": "ABC-1", "call": 2}
+    assert calls == ["ABC-1", "ABC-1"]
+
+
+def test_force_refresh_and_invalidate_bypass_cache(mock_transport, clock, monkeypatch):
+    calls, _ = mock_transport
+    client = JiraMCPClient(base_url="http://jira.test", token="token")
+    ticket_metadata = importlib.import_module("jr_dev_agent.utils.load_ticket_metadata")
+    monkeypatch.setattr(ticket_metadata, "_jira_client", client)
+
+    client.fetch_ticket("ABC-1")
+    assert client.fetch_ticket("ABC-1", force_refresh=True)["call"] == 2
+
+    ticket_metadata.invalidate_ticket_cache("ABC-1")
+    assert client.fetch_ticket("ABC-1")["call"] == 3
+    assert calls == ["ABC-1"] * 3
+
+
+def test_least_recently_used_ticket_evicted_at_capacity(mock_transport, clock, monkeypatch):
+    calls, _ = mock_transport
+    monkeypatch.setattr(jira_client, "TICKET_CACHE_MAXSIZE", 2)
+    client = JiraMCPClient(base_url="http://jira.test", token="token")
+
+    client.fetch_ticket("ABC-1")
+    client.fetch_ticket("ABC-2")
+    client.fetch_ticket("ABC-1")  # hit; ABC-2 is now least recently used
+    client.fetch_ticket("ABC-3")
+
+    client.fetch_ticket("ABC-1")
+    client.fetch_ticket("ABC-2")
+    assert calls == ["ABC-1", "ABC-2", "ABC-3", "ABC-2"]
+
+
+def test_stale_ticket_served_when_refetch_fails(mock_transport, clock):
+    calls, responses = mock_transport
+    client = JiraMCPClient(base_url="http://jira.test", token="token", cache_ttl=60)
+
+    client.fetch_ticket("ABC-1")
+    clock[0] += 61
+    responses.append(httpx.ConnectError("connection refused"))
+
+    assert client.fetch_ticket("ABC-1") == {"ticket_id": "ABC-1", "call": 1}
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_stale_ticket_served_when_refetch_fails(mock_transport, clock):
+    _, responses = mock_transport
+    client = JiraMCPClient(base_url="http://jira.test", token="token", cache_ttl=60)
+
+    await client.afetch_ticket("ABC-1")
+    clock[0] += 61
+    responses.append(500)
+
+    assert await client.afetch_ticket("ABC-1") == {"ticket_id": "ABC-1", "call": 1}
+    with pytest.raises(RuntimeError, match="Failed to call Jira MCP"):
+        responses.append(500)
+        await client.afetch_ticket("ABC-2")
@@ -0,0 +1,30 @@
+import asyncio
+
+import pytest
+from jr_dev_agent.graph.jr_dev_graph import JrDevGraph
+
+pytestmark = pytest.mark.usefixtures("memory_root")
+
+
+@pytest.mark.asyncio
+async def test_session_start_reaches_pess_before_prompt_generated():
+    graph = JrDevGraph()
+    await graph.initialize()
+    events = []
+
+    async def record_session_start(ticket_id, session_id, metadata=None):
+        await asyncio.sleep(0.05)
+        events.append("session_start")
+
+    async def record_prompt_generated(**kwargs):
+        events.append("prompt_generated")
+
+    graph.pess_client.record_session_start = record_session_start
+    graph.pess_client.record_prompt_generated = record_prompt_generated
+
+    ticket = {"ticket_id": "ABC-1", "summary": "Add a resolver", "description": "Add a resolver"}
+    result = await graph.process_ticket(ticket, "session-1")
+
+    assert result["prompt"]
+    assert events == ["session_start", "prompt_generated"]
+    assert graph._session_starts == {}
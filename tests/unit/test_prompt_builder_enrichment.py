@@ -0,0 +1,17 @@
+from jr_dev_agent.services.prompt_builder import PromptBuilder
+
+
+def test_enrichment_cache_keeps_equal_but_distinct_values_apart():
+    """3 and 3.0, 1 and True compare equal but must render as written"""
+    render = PromptBuilder._format_enrichment
+
+    assert "**Complexity Score**: 3\n" in render({"complexity_score": 3})
+    assert "**Complexity Score**: 3.0\n" in render({"complexity_score": 3.0})
+    assert "**Related Files**: 1\n" in render({"related_files": [1]})
+    assert "**Related Files**: True\n" in render({"related_files": [True]})
+
+
+def test_enrichment_renders_unhashable_items():
+    section = PromptBuilder._format_enrichment({"related_tickets": [{"id": "ABC-1"}]})
+
+    assert "**Related Tickets**: {'id': 'ABC-1'}\n" in section
@@ -0,0 +1,69 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from jr_dev_agent.services.synthetic_memory import SyntheticMemory
+
+
+@pytest.fixture
+def memory(tmp_path):
+    return SyntheticMemory(root=str(tmp_path / "syntheticMemory"))
+
+
+def _ticket(feature):
+    return {"ticket_id": "CEPG-1", "summary": "Update resolver", "description": "", "feature": feature}
+
+
+def _read_json(path):
+    return json.loads(path.read_text())
+
+
+@pytest.mark.asyncio
+async def test_record_completion_uses_ticket_index(memory, tmp_path):
+    await memory.enrich_context(_ticket("feature_b"))
+    root = tmp_path / "syntheticMemory"
+
+    assert _read_json(root / "_index" / "CEPG-1.json") == ["feature_b"]
+
+    await memory.record_completion("CEPG-1", "http://pr/1", 0.9)
+
+    agent_run = _read_json(root / "features" / "feature_b" / "CEPG-1" / "agent_run.json")
+    assert agent_run["status"] == "completed"
+    assert agent_run["pr_url"] == "http://pr/1"
+
+
+@pytest.mark.asyncio
+async def test_record_completion_searches_for_unindexed_packs(memory, tmp_path):
+    root = tmp_path / "syntheticMemory"
+    legacy_pack = root / "features" / "feature_a" / "CEPG-1"
+    legacy_pack.mkdir(parents=True)
+    (legacy_pack / "agent_run.json").write_text(json.dumps({"result": "merged"}))
+
+    await memory.record_completion("CEPG-1", "http://pr/1", 0.9)
+
+    agent_run = _read_json(legacy_pack / "agent_run.json")
+    assert agent_run["status"] == "completed"
+    assert agent_run["result"] == "merged"
+
+
+@pytest.mark.asyncio
+async def test_record_completion_searches_when_indexed_dir_is_missing(memory, tmp_path):
+    root = tmp_path / "syntheticMemory"
+    (root / "_index").mkdir(parents=True)
+    (root / "_index" / "CEPG-1.json").write_text(json.dumps(["feature_gone"]))
+    pack = root / "features" / "feature_a" / "CEPG-1"
+    pack.mkdir(parents=True)
+
+    await memory.record_completion("CEPG-1", None, 0.5)
+
+    assert _read_json(pack / "agent_run.json")["status"] == "completed"
+
+
+def test_concurrent_index_updates_keep_every_feature(memory, tmp_path):
+    features = [f"feature_{i}" for i in range(16)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda feature: memory._index_ticket("CEPG-1", feature), features))
+
+    indexed = _read_json(tmp_path / "syntheticMemory" / "_index" / "CEPG-1.json")
+    assert sorted(indexed) == sorted(features)
@@ -0,0 +1,29 @@
+import asyncio
+import functools
+
+import pytest
+from jr_dev_agent.prebuilt.tool_node import ToolNode
+
+
+class _AsyncTool:
+    async def __call__(self, state):
+        await asyncio.sleep(0)
+        return {"callable_object": True}
+
+
+async def _tagged(state, tag):
+    await asyncio.sleep(0)
+    return {tag: True}
+
+
+@pytest.mark.asyncio
+async def test_awaits_every_kind_of_async_tool():
+    node = ToolNode([
+        lambda state: {"sync": True},
+        _AsyncTool(),
+        functools.partial(_tagged, tag="partial"),
+    ])
+
+    state = await node({})
+
+    assert state == {"sync": True, "callable_object": True, "partial": True}